@@ -1,9 +1,24 @@
 import os
+import re
 import json
+import hashlib
+import logging
+import math
+import mmap
 import time
+import queue
+import random
 import threading
+import unicodedata
+import wave
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Tuple
+from itertools import islice
+from operator import mul
+from typing import Callable, Dict, Iterable, List, Tuple
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -21,11 +36,32 @@ _spec = importlib.util.spec_from_file_location("api_module", API_PATH)
 api = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(api)
 
+log = logging.getLogger(__name__)
+
 APP_TITLE = "Vocabulary Reader – Context Aware"
 DEFAULT_FONT_SIZE = 18
 MIN_FONT, MAX_FONT = 12, 36
+FONT_DEBOUNCE_MS = 180
+PAGED_VIEW_THRESHOLD = 2 * 1024 * 1024
+PAGE_CHARS = 60000
+PAGE_EDGE = 0.05
+PAGE_UNIT_BYTES = 8192
+RESTORE_SLICE_MS = 25
+PREFETCH_DEPTH = 3
+PREFETCH_WORKERS = 2
+ALIGNMENT_WORKERS = 4
+ENTRY_AUDIO_CHUNK = 200
+READING_SPEEDS = (0.75, 1.0, 1.25)
+STRETCH_WINDOW_S = 0.03
+STRETCH_TOLERANCE_S = 0.008
+STRETCH_SEARCH_HZ = 5512
+UI_DRAIN_MS = 15
+UI_DRAIN_BUDGET_MS = 8
+UI_IDLE_DRAIN_MS = 100
 
 HIGHLIGHT_COLOR = "#fff7ad"
+BUBBLE_POOL_LIMIT = 400
+VIETSUB_ALIGNMENT = True
 THEMES = {
     "light": {"text_fg": "#222222", "text_bg": "#ffffff", "sel_bg": "#5dade2"},
     "dark": {"text_fg": "#e6e6e6", "text_bg": "#1f1f1f", "sel_bg": "#5dade2"},
@@ -33,6 +69,15 @@ THEMES = {
 
 CACHE_DIR = os.path.join(os.getcwd(), "cache", "audio")
 os.makedirs(CACHE_DIR, exist_ok=True)
+AUDIO_CACHE_MAX_BYTES = 300 * 1024 * 1024
+AUDIO_CACHE_MAX_AGE_DAYS = 60
+AUDIO_CACHE_SWEEP_S = 60
+SOUND_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RENDER_DIR = os.path.join(CACHE_DIR, "renders")
+RENDER_FOLLOW_MS = 100
+SESSION_DIR = os.path.join(os.getcwd(), "cache", "session")
+JOURNAL_COMPACT_S = 60
+JOURNAL_COMPACT_RECORDS = 500
 
 
 def current_iso() -> str:
@@ -41,6 +86,26 @@ def current_iso() -> str:
     return dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def ensure_mixer():
+    """Initialize pygame's mixer if needed; ``pygame.mixer.Sound`` fails without it."""
+
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+
+def text_digest(text: str) -> str:
+    """Hash of ``text`` that is the same in every run, unlike ``hash()``."""
+
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def fold_diacritics(text: str) -> str:
+    """Lowercase ``text`` and strip accents, so "Nghĩa Đen" matches "nghia den"."""
+
+    text = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
 @dataclass
 class WordEntry:
     display: str
@@ -55,6 +120,1658 @@ class WordEntry:
     surface: str = ""
 
 
+def line_start_offsets(text: str) -> List[int]:
+    return [0, *(match.end() for match in re.finditer("\n", text))]
+
+
+def paragraph_spans(text: str, base: int = 0) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    position = base
+    for part in text.split("\n\n"):
+        stripped = part.strip()
+        if stripped:
+            start = position + part.index(stripped)
+            spans.append((start, start + len(stripped)))
+        position += len(part) + 2
+    return spans
+
+
+def sentence_spans(text: str, base: int = 0) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    index = 0
+    for sentence in sent_tokenize(text):
+        start = text.find(sentence, index)
+        if start == -1:
+            start = index
+        end = start + len(sentence)
+        spans.append((base + start, base + end))
+        index = end
+    return spans
+
+
+def estimate_word_timings(text: str, duration: float) -> List[Tuple[float, float, int, int]]:
+    """Spread ``duration`` over the words of ``text``, longer words and punctuation taking longer.
+
+    Rows are ``(start_s, end_s, start, end)`` with character offsets into ``text``.
+    """
+
+    words = [(match.start(), match.end()) for match in re.finditer(r"\S+", text)]
+    weights = []
+    for start, end in words:
+        tail = text[end - 1]
+        pause = 3.0 if tail in ".!?;:" else 1.5 if tail in ",—–" else 0.0
+        weights.append(end - start + 1 + pause)
+    total = sum(weights) or 1.0
+    rows: List[Tuple[float, float, int, int]] = []
+    elapsed = 0.0
+    for (start, end), weight in zip(words, weights):
+        step = duration * weight / total
+        rows.append((elapsed, elapsed + step, start, end))
+        elapsed += step
+    return rows
+
+
+def time_stretch(samples: array, channels: int, frequency: int, speed: float) -> array:
+    """Play ``samples`` (interleaved 16-bit PCM) ``speed`` times faster without changing the pitch.
+
+    WSOLA: overlap-added Hann frames, each shifted to line up with the previous one.
+    """
+
+    size = int(frequency * STRETCH_WINDOW_S) // 2 * 2
+    hop = size // 2
+    tolerance = int(frequency * STRETCH_TOLERANCE_S)
+    total = len(samples) // channels
+    if total < size * 2:
+        return samples
+    guide = samples[::channels]
+    step = max(1, frequency // STRETCH_SEARCH_HZ)
+    coarse = guide[::step]
+
+    def match(target: array, source: array, at: int, stride: int) -> int:
+        return sum(map(mul, target, source[at : at + len(target) * stride : stride]))
+
+    window = [0.5 - 0.5 * math.cos(2 * math.pi * i / size) for i in range(size)]
+    mixed = [0.0] * ((int(total / speed) + size) * channels)
+    previous = 0
+    frame = 0
+    while True:
+        nominal = int(frame * hop * speed)
+        if frame == 0:
+            start = 0
+        else:
+            # The previous frame's natural continuation is what this frame overlaps.
+            low = max(0, nominal - tolerance)
+            high = min(total - size, nominal + tolerance)
+            target = coarse[(previous + hop) // step : (previous + size) // step]
+            best = max(range(-(-low // step), high // step + 1), key=lambda at: match(target, coarse, at, 1), default=None)
+            if best is None:
+                start = nominal
+            else:
+                target = guide[previous + hop : previous + size : 2]
+                around = range(max(low, (best - 1) * step), min(high, (best + 1) * step) + 1)
+                start = max(around, key=lambda at: match(target, guide, at, 2))
+        if start + size > total or (frame + 1) * hop * channels > len(mixed) - size * channels:
+            break
+        for channel in range(channels):
+            source = slice(start * channels + channel, (start + size) * channels, channels)
+            target_out = slice(frame * hop * channels + channel, (frame * hop + size) * channels, channels)
+            mixed[target_out] = [out + sample * weight for out, sample, weight in zip(mixed[target_out], samples[source], window)]
+        previous = start
+        frame += 1
+    length = (frame * hop + hop) * channels
+    # The Hann windows half a window apart sum to one, so the mix stays within 16 bits.
+    return array("h", map(int, mixed[:length]))
+
+
+class _SkipNode:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Tuple, levels: int):
+        self.value = value
+        self.next: List["_SkipNode"] = [None] * levels  # type: ignore[list-item]
+        self.width: List[int] = [1] * levels
+
+
+class OrderedEntryIndex:
+    """Entry keys in (abs_start, abs_end) order, kept in an indexable skip list."""
+
+    LEVELS = 24
+    _END = (float("inf"), float("inf"), "")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._tail = _SkipNode(self._END, 0)
+        self._head = _SkipNode((), self.LEVELS)
+        self._head.next = [self._tail] * self.LEVELS
+        self._values: Dict[str, Tuple[int, int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not self._tail:
+            yield node.value[2]
+            node = node.next[0]
+
+    def _chain(self, value: Tuple) -> Tuple[List[_SkipNode], List[int]]:
+        chain: List[_SkipNode] = [self._head] * self.LEVELS
+        positions = [0] * self.LEVELS
+        node = self._head
+        position = 0
+        for level in reversed(range(self.LEVELS)):
+            while node.next[level].value < value:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def add(self, key: str, abs_start: int, abs_end: int) -> int:
+        """Insert ``key`` (replacing its old position) and return its 0-based rank."""
+
+        self.discard(key)
+        value = (abs_start, abs_end, key)
+        chain, positions = self._chain(value)
+        levels = 1
+        while levels < self.LEVELS and random.random() < 0.5:
+            levels += 1
+        node = _SkipNode(value, levels)
+        rank = positions[0]
+        for level in range(levels):
+            previous = chain[level]
+            distance = rank - positions[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            node.width[level] = previous.width[level] - distance
+            previous.width[level] = distance + 1
+        for level in range(levels, self.LEVELS):
+            chain[level].width[level] += 1
+        self._values[key] = value
+        return rank
+
+    def discard(self, key: str) -> int | None:
+        """Remove ``key`` and return the rank it had, or None if it was absent."""
+
+        value = self._values.pop(key, None)
+        if value is None:
+            return None
+        chain, positions = self._chain(value)
+        node = chain[0].next[0]
+        for level in range(len(node.next)):
+            previous = chain[level]
+            previous.width[level] += node.width[level] - 1
+            previous.next[level] = node.next[level]
+        for level in range(len(node.next), self.LEVELS):
+            chain[level].width[level] -= 1
+        return positions[0]
+
+    def rank(self, key: str) -> int | None:
+        value = self._values.get(key)
+        if value is None:
+            return None
+        return self._chain(value)[1][0]
+
+    def keys_from(self, rank: int = 0):
+        """Yield keys in text order, starting at ``rank``."""
+
+        node = self._head
+        remaining = rank + 1
+        for level in reversed(range(self.LEVELS)):
+            while node.next[level] is not self._tail and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        if remaining:
+            node = node.next[0]
+        while node is not self._tail:
+            yield node.value[2]
+            node = node.next[0]
+
+    def keys_between(self, start: int, end: int):
+        """Yield keys whose abs_start lies in [start, end], in text order."""
+
+        node = self._chain((start,))[0][0].next[0]
+        while node is not self._tail and node.value[0] <= end:
+            yield node.value[2]
+            node = node.next[0]
+
+    def order_key(self, key: str) -> Tuple[int, int, str]:
+        return self._values[key]
+
+
+class EntrySearchIndex:
+    """Finds entries by display word, surface form or Vietnamese meaning.
+
+    Short terms use a two-character prefix table, longer ones trigram sets.
+    """
+
+    SHORT = 2
+
+    def __init__(self):
+        self.entry_words: Dict[str, set] = {}
+        self.words: Dict[str, set] = {}
+        self.prefixes: Dict[str, set] = {}
+        self.trigrams: Dict[str, set] = {}
+
+    def __len__(self) -> int:
+        return len(self.entry_words)
+
+    def add(self, key: str, entry: WordEntry):
+        self.remove(key)
+        fields = " ".join((entry.display or "", entry.surface or "", entry.vi_meaning or ""))
+        words = set(re.findall(r"\w+", fold_diacritics(fields)))
+        self.entry_words[key] = words
+        for word in words:
+            keys = self.words.get(word)
+            if keys is None:
+                keys = self.words[word] = set()
+                for start in range(len(word) - 2):
+                    self.trigrams.setdefault(word[start : start + 3], set()).add(word)
+            keys.add(key)
+        for prefix in {word[:size] for word in words for size in range(1, min(self.SHORT, len(word)) + 1)}:
+            self.prefixes.setdefault(prefix, set()).add(key)
+
+    def remove(self, key: str):
+        words = self.entry_words.pop(key, None)
+        if words is None:
+            return
+        for word in words:
+            keys = self.words[word]
+            keys.discard(key)
+            if not keys:
+                del self.words[word]
+                for start in range(len(word) - 2):
+                    self._discard(self.trigrams, word[start : start + 3], word)
+        for prefix in {word[:size] for word in words for size in range(1, min(self.SHORT, len(word)) + 1)}:
+            self._discard(self.prefixes, prefix, key)
+
+    @staticmethod
+    def _discard(table: Dict[str, set], gram: str, item: str):
+        items = table.get(gram)
+        if items is not None:
+            items.discard(item)
+            if not items:
+                del table[gram]
+
+    def _term_keys(self, term: str) -> set:
+        if len(term) <= self.SHORT:
+            return self.prefixes.get(term, set())
+        grams = sorted((self.trigrams.get(term[start : start + 3], set()) for start in range(len(term) - 2)), key=len)
+        words = grams[0].intersection(*grams[1:])
+        matches = [self.words[word] for word in words if term in word]
+        if len(matches) == 1:
+            return matches[0]
+        return set().union(*matches)
+
+    def search(self, query: str) -> set | None:
+        """Return the keys matching every word of ``query``, or None for an empty query."""
+
+        terms = set(re.findall(r"\w+", fold_diacritics(query)))
+        if not terms:
+            return None
+        matches = sorted((self._term_keys(term) for term in terms), key=len)
+        return matches[0].intersection(*matches[1:])
+
+
+class PagedDocument:
+    """A memory-mapped UTF-8 text file indexed by paragraph, read one page at a time."""
+
+    SEPARATOR = re.compile(rb"\r?\n\r?\n")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._handle = open(path, "rb")
+        self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.byte_spans: List[Tuple[int, int]] = []
+        self.starts: List[int] = []
+        self.lengths: List[int] = []
+        byte_start = 0
+        char_start = 0
+        for match in self.SEPARATOR.finditer(self._map):
+            char_start = self._append_block(byte_start, match.start(), char_start) + 2
+            byte_start = match.end()
+        self._append_block(byte_start, len(self._map), char_start)
+
+    def _append_block(self, byte_start: int, byte_end: int, char_start: int) -> int:
+        while byte_end - byte_start > PAGE_UNIT_BYTES:
+            limit = byte_start + PAGE_UNIT_BYTES
+            cut = self._map.rfind(b"\n", byte_start + 1, limit)
+            if cut != -1:
+                unit_end = cut - 1 if self._map[cut - 1] == 0x0D else cut
+                next_start, gap = cut + 1, 1
+            else:
+                cut = self._map.rfind(b" ", byte_start + 1, limit)
+                if cut != -1:
+                    unit_end, next_start, gap = cut, cut + 1, 1
+                else:
+                    unit_end = limit
+                    while self._map[unit_end] & 0xC0 == 0x80:
+                        unit_end -= 1
+                    next_start, gap = unit_end, 0
+            char_start = self._append(byte_start, unit_end, char_start) + gap
+            byte_start = next_start
+        return self._append(byte_start, byte_end, char_start)
+
+    def _append(self, byte_start: int, byte_end: int, char_start: int) -> int:
+        length = len(self._decode(byte_start, byte_end))
+        self.byte_spans.append((byte_start, byte_end))
+        self.starts.append(char_start)
+        self.lengths.append(length)
+        return char_start + length
+
+    def _decode(self, byte_start: int, byte_end: int) -> str:
+        return self._map[byte_start:byte_end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def paragraph_at(self, offset: int) -> int:
+        return max(0, bisect_right(self.starts, offset) - 1)
+
+    def text(self, first: int, last: int) -> str:
+        return self._decode(self.byte_spans[first][0], self.byte_spans[last - 1][1])
+
+    def slice(self, start: int, end: int) -> str:
+        first = self.paragraph_at(start)
+        last = self.paragraph_at(max(start, end - 1)) + 1
+        byte_end = self.byte_spans[last][0] if last < len(self.starts) else len(self._map)
+        base = self.starts[first]
+        return self._decode(self.byte_spans[first][0], byte_end)[start - base : end - base]
+
+    def window_around(self, offset: int, size: int) -> Tuple[int, int]:
+        center = self.paragraph_at(offset)
+        first, last = center, center + 1
+        while first > 0 and self.starts[center] - self.starts[first] < size // 2:
+            first -= 1
+        while last < len(self.starts) and self.starts[last - 1] + self.lengths[last - 1] - self.starts[first] < size:
+            last += 1
+        return first, last
+
+    def iter_paragraph_spans(self):
+        for index, start in enumerate(self.starts):
+            yield from paragraph_spans(self.text(index, index + 1), start)
+
+    def close(self):
+        self._map.close()
+        self._handle.close()
+
+
+class FontMetricsCache:
+    """Line height and digit width per (family, size, weight), measured once."""
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self._metrics: Dict[Tuple[str, int, str], Tuple[int, int]] = {}
+
+    def get(self, family: str, size: int, weight: str = "normal") -> Tuple[int, int]:
+        key = (family, size, weight)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            probe = tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+            metrics = (probe.metrics("linespace"), probe.measure("0"))
+            self._metrics[key] = metrics
+        return metrics
+
+
+class BubbleLabelPool:
+    """Reusable number labels for one Text widget, hidden on release instead of destroyed."""
+
+    def __init__(self, parent: tk.Text, font: tkfont.Font, limit: int = BUBBLE_POOL_LIMIT):
+        self.parent = parent
+        self.font = font
+        self.limit = limit
+        self.idle: List[tk.Label] = []
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self) -> tk.Label | None:
+        if self.idle:
+            label = self.idle.pop()
+        elif self.created < self.limit:
+            label = tk.Label(self.parent, font=self.font, bg=HIGHLIGHT_COLOR, fg="#000000", padx=1, pady=0, bd=0)
+            self.created += 1
+        else:
+            return None
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return label
+
+    def release(self, label: tk.Label):
+        label.place_forget()
+        self.in_use -= 1
+        self.idle.append(label)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self.created,
+            "in_use": self.in_use,
+            "idle": len(self.idle),
+            "high_water": self.high_water,
+            "limit": self.limit,
+        }
+
+
+class HighlightBatch:
+    """Tag ranges and marks of one render pass, applied with one Tcl call per tag."""
+
+    MARK_PROC = "::vocab_reader_set_marks"
+
+    def __init__(self, text: tk.Text, line_starts: List[int] | None = None):
+        self.text = text
+        self.line_starts = line_starts
+        self.ranges: Dict[str, List[str]] = {}
+        self.marks: List[str] = []
+
+    def index(self, offset: int) -> str:
+        if self.line_starts is None:
+            self.line_starts = line_start_offsets(self.text.get("1.0", "end-1c"))
+        line = bisect_right(self.line_starts, offset) - 1
+        return f"{line + 1}.{offset - self.line_starts[line]}"
+
+    def tag(self, tag: str, start: str, end: str):
+        self.ranges.setdefault(tag, []).extend((start, end))
+
+    def mark(self, name: str, index: str):
+        self.marks.extend((name, index))
+
+    def apply(self):
+        for tag, indices in self.ranges.items():
+            self.text.tk.call(self.text._w, "tag", "add", tag, *indices)
+        if self.marks:
+            if not self.text.tk.call("info", "procs", self.MARK_PROC):
+                self.text.tk.eval(
+                    f"proc {self.MARK_PROC} {{w marks}} {{"
+                    " foreach {name index} $marks { $w mark set $name $index; $w mark gravity $name left } }"
+                )
+            self.text.tk.call(self.MARK_PROC, self.text._w, tuple(self.marks))
+        self.ranges.clear()
+        self.marks.clear()
+
+
+class NumberBubbleOverlay:
+    """Numbered bubbles drawn over a Text widget, with labels only for the visible ones."""
+
+    SPACE_TAG = "bubble_space"
+
+    def __init__(
+        self,
+        text: tk.Text,
+        font: tkfont.Font,
+        height: int,
+        number_of: Callable[[str], int | None],
+        keys_in_view: Callable[[str, str], Iterable[str]] | None = None,
+    ):
+        self.text = text
+        self.number_of = number_of
+        self.keys_in_view = keys_in_view or self._marked_keys
+        self.marks: Dict[str, str] = {}
+        self.mark_keys: Dict[str, str] = {}
+        self.labels: Dict[str, tk.Label] = {}
+        self.label_numbers: Dict[str, int | None] = {}
+        self.height = 0
+        self.pool = BubbleLabelPool(text, font)
+        self._layout_job: str | None = None
+        self.text.bind("<Configure>", lambda _event: self.schedule_layout(), add="+")
+        self.set_height(height)
+
+    def track(self, key: str, mark: str):
+        """Show a bubble at ``mark``, which the caller has set in the text."""
+
+        self.marks[key] = mark
+        self.mark_keys[mark] = key
+        self.schedule_layout()
+
+    def remove(self, key: str):
+        mark = self.marks.pop(key, None)
+        if mark:
+            self.mark_keys.pop(mark, None)
+            self.text.mark_unset(mark)
+        self.label_numbers.pop(key, None)
+        label = self.labels.pop(key, None)
+        if label is not None:
+            self.pool.release(label)
+
+    def clear(self):
+        if self.marks:
+            self.text.mark_unset(*self.marks.values())
+        for label in self.labels.values():
+            self.pool.release(label)
+        self.marks.clear()
+        self.mark_keys.clear()
+        self.label_numbers.clear()
+        self.labels.clear()
+
+    def renumber(self, from_number: int = 1):
+        """Relabel visible bubbles numbered ``from_number`` or later whose number moved."""
+
+        for key, label in self.labels.items():
+            current = self.label_numbers.get(key)
+            if current is not None and current < from_number:
+                continue
+            number = self.number_of(key)
+            if number != current:
+                self.label_numbers[key] = number
+                label.config(text=str(number or ""))
+
+    def set_height(self, height: int):
+        if height != self.height:
+            self.height = height
+            self.text.tag_configure(self.SPACE_TAG, spacing1=height, spacing2=height)
+            self.text.tag_lower(self.SPACE_TAG)
+        self.schedule_layout()
+
+    def schedule_layout(self):
+        if self._layout_job is None:
+            self._layout_job = self.text.after_idle(self.layout)
+
+    def _marked_keys(self, first: str, last: str):
+        name = self.text.mark_next(first)
+        while name and self.text.compare(name, "<=", last):
+            key = self.mark_keys.get(name)
+            if key is not None:
+                yield key
+            name = self.text.mark_next(name)
+
+    def layout(self):
+        self._layout_job = None
+        # Content may have been replaced since the last pass; one call re-covers it.
+        self.text.tag_add(self.SPACE_TAG, "1.0", "end")
+        first = self.text.index("@0,0")
+        last = self.text.index(f"@0,{self.text.winfo_height()} lineend")
+        visible: Dict[str, Tuple[int, int]] = {}
+        for key in self.keys_in_view(first, last):
+            mark = self.marks.get(key)
+            if mark is None:
+                continue
+            bbox = self.text.bbox(mark)
+            line = self.text.dlineinfo(mark) if bbox else None
+            if line:
+                visible[key] = (bbox[0], line[1])
+        for key in [key for key in self.labels if key not in visible]:
+            self.pool.release(self.labels.pop(key))
+            self.label_numbers.pop(key, None)
+        for key, (x, y) in visible.items():
+            label = self.labels.get(key)
+            if label is None:
+                label = self.pool.acquire()
+                if label is None:
+                    continue
+                number = self.number_of(key)
+                label.config(text=str(number or ""))
+                self.labels[key] = label
+                self.label_numbers[key] = number
+            label.place(x=x, y=y, anchor="nw")
+
+
+class VirtualEntryTable:
+    """A Treeview that shows only the rows of an OrderedEntryIndex in view."""
+
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        scrollbar: ttk.Scrollbar,
+        index: OrderedEntryIndex,
+        row_values: Callable[[str, int], List],
+        on_show: Callable[[List[str]], None] | None = None,
+    ):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.index = index
+        self.row_values = row_values
+        self.on_show = on_show
+        self.shown: List[str] = []
+        self.top = 0
+        self.slots: List[str] = []
+        self.slot_keys: List[str | None] = []
+        self.selected: str | None = None
+        self.marked: Tuple[str, str] | None = None
+        self.matches: set | None = None
+        self.view: List[str] = []
+        self.view_positions: Dict[str, int] = {}
+        self._view_source = iter(())
+        self._render_job: str | None = None
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", lambda _event: self.refresh(), add="+")
+        tree.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1, "units"))
+        tree.bind("<Button-4>", lambda _event: self.scroll(-1, "units"))
+        tree.bind("<Button-5>", lambda _event: self.scroll(1, "units"))
+        tree.bind("<Up>", lambda _event: self._step_selection(-1))
+        tree.bind("<Down>", lambda _event: self._step_selection(1))
+
+    def key_of(self, item: str) -> str | None:
+        if item in self.slots:
+            return self.slot_keys[self.slots.index(item)]
+        return None
+
+    def take_selection(self) -> str | None:
+        """Return the key the user just selected, or None if the selection did not move to a new entry."""
+
+        selection = self.tree.selection()
+        key = self.key_of(selection[0]) if selection else None
+        if key is None or key == self.selected:
+            return None
+        self.selected = key
+        return key
+
+    def mark(self, key: str | None, tag: str | None = None):
+        self.marked = (key, tag) if key is not None and tag else None
+        self.refresh()
+
+    def set_filter(self, keys: set | None):
+        self.matches = keys
+        self.view = []
+        self.view_positions = {}
+        if keys is None:
+            self._view_source = iter(())
+        elif len(keys) * 32 > len(self.index):
+            self._view_source = (key for key in self.index if key in keys)
+        else:
+            self._view_source = iter(sorted(keys, key=self.index.order_key))
+        self.top = 0
+        self.refresh()
+
+    def _extend_view(self, size: int):
+        for key in islice(self._view_source, max(0, size - len(self.view))):
+            self.view_positions[key] = len(self.view)
+            self.view.append(key)
+
+    def _count(self) -> int:
+        return len(self.matches) if self.matches is not None else len(self.index)
+
+    def _position(self, key: str) -> int | None:
+        if self.matches is None:
+            return self.index.rank(key)
+        if key not in self.matches:
+            return None
+        while key not in self.view_positions:
+            self._extend_view(len(self.view) + 256)
+        return self.view_positions[key]
+
+    def _keys_from(self, position: int, count: int) -> List[str]:
+        if self.matches is None:
+            return list(islice(self.index.keys_from(position), count))
+        self._extend_view(position + count)
+        return self.view[position : position + count]
+
+    def see(self, key: str):
+        rank = self._position(key)
+        if rank is None:
+            return
+        rows = self._visible_rows()
+        if rank < self.top:
+            self.top = rank
+        elif rank >= self.top + rows:
+            self.top = rank - rows + 1
+        self.refresh()
+
+    def scroll(self, amount: int, what: str):
+        step = self._visible_rows() if what == "pages" else 3
+        self.top += amount * step
+        self.refresh()
+        return "break"
+
+    def refresh(self):
+        if self._render_job is None:
+            self._render_job = self.tree.after_idle(self.render)
+
+    def render(self):
+        self._render_job = None
+        rows = self._visible_rows()
+        while len(self.slots) < rows:
+            self.slots.append(self.tree.insert("", "end"))
+            self.slot_keys.append(None)
+        total = self._count()
+        self.top = max(0, min(self.top, total - rows))
+        keys = self._keys_from(self.top, rows)
+        if self.on_show is not None and keys != self.shown:
+            self.on_show(keys)
+        self.shown = keys
+        if self.selected is not None and self.selected not in self.index:
+            self.selected = None
+        selected_slot = None
+        for position, slot in enumerate(self.slots):
+            key = keys[position] if position < len(keys) else None
+            self.slot_keys[position] = key
+            if key is None:
+                self.tree.detach(slot)
+                continue
+            tags = (self.marked[1],) if self.marked and self.marked[0] == key else ()
+            self.tree.move(slot, "", position)
+            number = self.top + position + 1 if self.matches is None else self.index.rank(key) + 1
+            self.tree.item(slot, values=self.row_values(key, number), tags=tags)
+            if key == self.selected:
+                selected_slot = slot
+        current = self.tree.selection()
+        if selected_slot is None and current:
+            self.tree.selection_remove(*current)
+        elif selected_slot is not None and current != (selected_slot,):
+            self.tree.selection_set(selected_slot)
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + len(keys)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _visible_rows(self) -> int:
+        row_height = int(ttk.Style(self.tree).lookup("Treeview", "rowheight") or 20)
+        return max(1, (self.tree.winfo_height() - row_height) // row_height)
+
+    def _on_scrollbar(self, action: str, value: str, what: str | None = None):
+        if action == "moveto":
+            self.top = int(float(value) * self._count())
+            self.refresh()
+        else:
+            self.scroll(int(value), what or "units")
+
+    def _step_selection(self, step: int):
+        rank = self._position(self.selected) if self.selected is not None else None
+        rank = 0 if rank is None else max(0, min(self._count() - 1, rank + step))
+        keys = self._keys_from(rank, 1)
+        if not keys:
+            return "break"
+        key = keys[0]
+        self.see(key)
+        self.render()
+        position = self.slot_keys.index(key)
+        self.tree.selection_set(self.slots[position])
+        self.tree.focus(self.slots[position])
+        return "break"
+
+
+class UICommandQueue:
+    """Runs callables posted by worker threads on the Tk thread."""
+
+    def __init__(self, widget: tk.Misc):
+        self.widget = widget
+        self.commands: queue.SimpleQueue = queue.SimpleQueue()
+        self.interval = UI_DRAIN_MS
+        self.widget.after(UI_DRAIN_MS, self._drain)
+
+    def post(self, func: Callable, *args):
+        self.commands.put((func, args))
+
+    def _drain(self):
+        deadline = time.perf_counter() + UI_DRAIN_BUDGET_MS / 1000
+        ran = False
+        while time.perf_counter() < deadline:
+            try:
+                func, args = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            ran = True
+            try:
+                func(*args)
+            except Exception as exc:
+                self.widget.report_callback_exception(type(exc), exc, exc.__traceback__)
+        self.interval = UI_DRAIN_MS if ran else min(self.interval * 2, UI_IDLE_DRAIN_MS)
+        self.widget.after(self.interval if self.commands.empty() else 1, self._drain)
+
+
+class AudioCache:
+    """Index of the synthesized clips in the audio cache directory.
+
+    A background thread adopts unknown files and evicts old and least recently used ones.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, tts, directory: str):
+        self.tts = tts
+        self.directory = directory
+        self.enabled = callable(getattr(tts, "synthesize", None))
+        self.lock = threading.Lock()
+        self.index: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self.wake = threading.Event()
+        try:
+            with open(os.path.join(directory, self.INDEX_NAME), "r", encoding="utf-8") as handle:
+                self.index = self._valid_items(json.load(handle))
+        except (OSError, ValueError):
+            self.index = {}
+        self.total_bytes = sum(item["size"] for item in self.index.values())
+        threading.Thread(target=self._sweeper, name="audio-cache", daemon=True).start()
+
+    @staticmethod
+    def _valid_items(data) -> Dict[str, Dict]:
+        """Keep the index items that have the expected shape; a damaged index is mostly recovered."""
+
+        if not isinstance(data, dict):
+            return {}
+        valid = {}
+        for key, item in data.items():
+            if (
+                isinstance(item, dict)
+                and isinstance(item.get("file"), str)
+                and isinstance(item.get("size"), int)
+                and isinstance(item.get("last_access"), (int, float))
+            ):
+                valid[key] = item
+        return valid
+
+    @staticmethod
+    def key(text: str, speed: float = 1.0) -> str:
+        if speed != 1.0:
+            text = f"{speed:g}x\n{text}"
+        return text_digest(text)
+
+    def contains(self, text: str, speed: float = 1.0) -> bool:
+        with self.lock:
+            item = self.index.get(self.key(text, speed))
+        return item is not None and os.path.exists(item["file"])
+
+    def lookup(self, text: str, speed: float = 1.0) -> str | None:
+        key = self.key(text, speed)
+        with self.lock:
+            item = self.index.get(key)
+            if item is not None and os.path.exists(item["file"]):
+                item["last_access"] = time.time()
+                self.hits += 1
+                self.dirty = True
+                return item["file"]
+            return None
+
+    def fetch(self, text: str, speed: float = 1.0) -> str:
+        """Return the audio file for ``text`` at ``speed``, synthesizing or stretching it on a miss."""
+
+        path = self.lookup(text, speed)
+        if path is not None:
+            return path
+        if speed != 1.0:
+            return self._stretch(text, speed)
+        path = self.tts.synthesize(text)
+        self.store(self.key(text), path)
+        return path
+
+    def _stretch(self, text: str, speed: float) -> str:
+        source = self.fetch(text)
+        mixer = pygame.mixer.get_init()
+        if not mixer or mixer[1] != -16:
+            # time_stretch works on signed 16-bit samples; play the normal clip instead.
+            return source
+        frequency, _, channels = mixer
+        samples = array("h", pygame.mixer.Sound(source).get_raw())
+        key = self.key(text, speed)
+        path = os.path.join(self.directory, key + ".wav")
+        # A cancelled fetch may still be writing this clip; each writer gets its own part file.
+        part = f"{path}.{threading.get_ident()}.part"
+        try:
+            with wave.open(part, "wb") as out:
+                out.setnchannels(channels)
+                out.setsampwidth(2)
+                out.setframerate(frequency)
+                out.writeframes(time_stretch(samples, channels, frequency, speed).tobytes())
+            os.replace(part, path)
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
+        self.store(key, path)
+        return path
+
+    def store(self, key: str, path: str):
+        now = time.time()
+        size = os.path.getsize(path)
+        with self.lock:
+            self.misses += 1
+            for stale in (key, f"file:{os.path.basename(path)}"):
+                if stale in self.index:
+                    self.total_bytes -= self.index.pop(stale)["size"]
+            self.index[key] = {"file": path, "size": size, "created": now, "last_access": now}
+            self.total_bytes += size
+            self.dirty = True
+            over = self.total_bytes > AUDIO_CACHE_MAX_BYTES
+        if over:
+            self.wake.set()
+
+    def word_timings(self, text: str, path: str, duration: float) -> List[Tuple[float, float, int, int]]:
+        """Word timing map for the clip of ``text``, kept in a sidecar next to the audio file."""
+
+        sidecar = path + ".words.json"
+        try:
+            with open(sidecar, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("duration") == duration:
+                return [tuple(row) for row in data["words"]]
+        except (OSError, ValueError, KeyError):
+            pass
+        rows = estimate_word_timings(text, duration)
+        try:
+            with open(sidecar, "w", encoding="utf-8") as handle:
+                json.dump({"duration": duration, "words": rows}, handle)
+        except OSError:
+            pass
+        return rows
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.index),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _sweeper(self):
+        while True:
+            # Files speak() writes during the session count against the limit from the next sweep on.
+            self._adopt_files()
+            self._evict()
+            self.save()
+            self.wake.wait(AUDIO_CACHE_SWEEP_S)
+            self.wake.clear()
+
+    def _adopt_files(self):
+        with self.lock:
+            known = {item["file"] for item in self.index.values()}
+        found = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.endswith((".json", ".tmp", ".part")) or entry.path in known:
+                continue
+            try:
+                found.append((entry, entry.stat()))
+            except OSError:
+                continue
+        if not found:
+            return
+        with self.lock:
+            # ``store`` may have indexed some of them since the scan started.
+            known = {item["file"] for item in self.index.values()}
+            for entry, info in found:
+                if entry.path in known:
+                    continue
+                self.index[f"file:{entry.name}"] = {
+                    "file": entry.path,
+                    "size": info.st_size,
+                    "created": info.st_mtime,
+                    "last_access": info.st_mtime,
+                }
+                self.total_bytes += info.st_size
+                self.dirty = True
+
+    def _evict(self):
+        expired_before = time.time() - AUDIO_CACHE_MAX_AGE_DAYS * 86400
+        doomed: List[str] = []
+        with self.lock:
+            for key, item in list(self.index.items()):
+                if item["last_access"] < expired_before or not os.path.exists(item["file"]):
+                    doomed.append(self.index.pop(key)["file"])
+            total = sum(item["size"] for item in self.index.values())
+            if total > AUDIO_CACHE_MAX_BYTES:
+                for key, item in sorted(self.index.items(), key=lambda pair: pair[1]["last_access"]):
+                    if total <= AUDIO_CACHE_MAX_BYTES * 0.9:
+                        break
+                    total -= item["size"]
+                    doomed.append(self.index.pop(key)["file"])
+            self.total_bytes = total
+            self.dirty = self.dirty or bool(doomed)
+        for path in doomed:
+            for name in (path, path + ".words.json"):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            snapshot = json.dumps(self.index)
+            self.dirty = False
+        index_path = os.path.join(self.directory, self.INDEX_NAME)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as handle:
+            handle.write(snapshot)
+        os.replace(index_path + ".tmp", index_path)
+
+
+class SpeechPrefetcher:
+    """Synthesizes the next ``depth`` clips while the current one plays."""
+
+    def __init__(self, cache: AudioCache, depth: int = PREFETCH_DEPTH, workers: int = PREFETCH_WORKERS):
+        self.cache = cache
+        self.depth = depth
+        self.enabled = cache.enabled
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-prefetch") if self.enabled else None
+        self.pending: Dict[Tuple[str, float], Future] = {}
+        self.lock = threading.Lock()
+        self.idle = threading.Event()
+        self.idle.set()
+
+    def schedule(self, texts: List[str], speed: float = 1.0):
+        wanted = [(text, speed) for text in texts[: self.depth + 1] if text.strip()]
+        submitted = []
+        with self.lock:
+            for job in [job for job in self.pending if job not in wanted]:
+                self.pending.pop(job).cancel()
+            for job in wanted:
+                if job not in self.pending:
+                    self.pending[job] = self.pool.submit(self.cache.fetch, *job)
+                    submitted.append(self.pending[job])
+            if submitted:
+                self.idle.clear()
+        # Outside the lock: a callback on a finished future runs right away.
+        for future in submitted:
+            future.add_done_callback(self._check_idle)
+
+    def _check_idle(self, _future: Future):
+        with self.lock:
+            if all(future.done() for future in self.pending.values()):
+                self.idle.set()
+
+    def get(self, text: str, speed: float = 1.0) -> str:
+        """Return the audio file for ``text`` at ``speed``, waiting for a prefetch already under way."""
+
+        with self.lock:
+            future = self.pending.pop((text, speed), None)
+        if future is None or future.cancelled():
+            return self.cache.fetch(text, speed)
+        return future.result()
+
+    def cancel(self):
+        with self.lock:
+            futures = list(self.pending.values())
+            self.pending.clear()
+            self.idle.set()
+        for future in futures:
+            future.cancel()
+
+
+class SoundCache:
+    """Decoded ``pygame.mixer.Sound`` objects of recently played clips, up to ``budget`` bytes."""
+
+    def __init__(self, budget: int = SOUND_CACHE_MAX_BYTES):
+        self.budget = budget
+        self.sounds: "OrderedDict[str, Tuple[object, int]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, key: str, path: str):
+        with self.lock:
+            item = self.sounds.get(key)
+            if item is not None:
+                self.sounds.move_to_end(key)
+                self.hits += 1
+                return item[0]
+        sound = pygame.mixer.Sound(path)
+        size = self._decoded_size(sound)
+        with self.lock:
+            self.misses += 1
+            if key in self.sounds:
+                self.total_bytes -= self.sounds.pop(key)[1]
+            if size <= self.budget:
+                self.sounds[key] = (sound, size)
+                self.total_bytes += size
+            while self.total_bytes > self.budget:
+                self.total_bytes -= self.sounds.popitem(last=False)[1][1]
+        return sound
+
+    @staticmethod
+    def _decoded_size(sound) -> int:
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.sounds),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class RenderedAudio:
+    """A document rendered to one WAV file, with the ``(start_s, end_s, abs_start, abs_end)`` of each sentence."""
+
+    WAV_MAX_BYTES = 2**32 - 1 - 36  # RIFF sizes are 32-bit and include the header
+
+    def __init__(self, wav_path: str, segments: List[Tuple[float, float, int, int]]):
+        self.wav_path = wav_path
+        self.segments = segments
+        self.starts = [segment[0] for segment in segments]
+
+    @classmethod
+    def load(cls, wav_path: str) -> "RenderedAudio | None":
+        try:
+            with open(wav_path + ".json", "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(wav_path):
+            return None
+        return cls(wav_path, [tuple(segment) for segment in data.get("segments", [])])
+
+    def segment_at(self, seconds: float) -> int | None:
+        index = bisect_right(self.starts, seconds) - 1
+        if index < 0 or seconds >= self.segments[index][1]:
+            return None
+        return index
+
+    @classmethod
+    def render(
+        cls,
+        cache: AudioCache,
+        spans: List[Tuple[int, int]],
+        read_slice: Callable[[int, int], str],
+        wav_path: str,
+        progress: Callable[[float], None],
+        cancelled: threading.Event,
+    ) -> "RenderedAudio | None":
+        """Synthesize ``spans`` on a thread pool and join them, in order, into ``wav_path``."""
+
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        if sample_format not in (-16, 8):
+            raise ValueError(f"Định dạng mixer ({sample_format}) không ghi được ra WAV.")
+        width = abs(sample_format) // 8
+        jobs = [(span, read_slice(*span).strip()) for span in spans]
+        jobs = [(span, text) for span, text in jobs if text]
+        texts = [text for _, text in jobs]
+        segments: List[Tuple[float, float, int, int]] = []
+        frames = 0
+        pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="tts-render")
+        try:
+            with wave.open(wav_path + ".part", "wb") as out:
+                out.setnchannels(channels)
+                out.setsampwidth(width)
+                out.setframerate(frequency)
+                for number, ((span, _), path) in enumerate(zip(jobs, pool.map(cache.fetch, texts))):
+                    if cancelled.is_set():
+                        return None
+                    raw = pygame.mixer.Sound(path).get_raw()
+                    if (frames * channels + len(raw) // width) * width > cls.WAV_MAX_BYTES:
+                        raise ValueError("Văn bản quá dài cho một file WAV (giới hạn 4 GB).")
+                    out.writeframes(raw)
+                    start = frames / frequency
+                    frames += len(raw) // (width * channels)
+                    segments.append((start, frames / frequency, span[0], span[1]))
+                    progress((number + 1) / len(jobs))
+            os.replace(wav_path + ".part", wav_path)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if os.path.exists(wav_path + ".part"):
+                os.remove(wav_path + ".part")
+        with open(wav_path + ".json", "w", encoding="utf-8") as handle:
+            json.dump({"segments": segments}, handle)
+        return cls(wav_path, segments)
+
+
+class BackgroundSynthesizer:
+    """Fills the audio cache for dictionary words on one thread while reading is idle."""
+
+    def __init__(self, cache: AudioCache, idle: threading.Event):
+        self.cache = cache
+        self.idle = idle
+        self.jobs: deque = deque()
+        self.queued: set = set()
+        self.backlog: deque = deque()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        if cache.enabled:
+            threading.Thread(target=self._run, name="entry-audio", daemon=True).start()
+
+    def submit(self, texts, first: bool = False):
+        with self.lock:
+            for text in reversed(list(texts)) if first else texts:
+                text = (text or "").strip()
+                if not text:
+                    continue
+                if text in self.queued:
+                    if not first:
+                        continue
+                    self.jobs.remove(text)
+                if first:
+                    self.jobs.appendleft(text)
+                else:
+                    self.jobs.append(text)
+                self.queued.add(text)
+        self.wakeup.set()
+
+    def submit_backlog(self, texts: List[str]):
+        with self.lock:
+            self.backlog = deque(texts)
+        self.wakeup.set()
+
+    def clear(self):
+        with self.lock:
+            self.jobs.clear()
+            self.queued.clear()
+            self.backlog.clear()
+
+    def _refill(self):
+        while self.backlog and len(self.jobs) < ENTRY_AUDIO_CHUNK:
+            text = (self.backlog.popleft() or "").strip()
+            if text and text not in self.queued:
+                self.jobs.append(text)
+                self.queued.add(text)
+
+    def _run(self):
+        while True:
+            self.wakeup.wait()
+            with self.lock:
+                if not self.jobs:
+                    self._refill()
+                if not self.jobs:
+                    self.wakeup.clear()
+                    continue
+                text = self.jobs.popleft()
+                self.queued.discard(text)
+            self.idle.wait()
+            if self.cache.contains(text):
+                continue
+            try:
+                self.cache.fetch(text)
+            except Exception:
+                pass
+
+
+class SentenceIndex:
+    """The sentence spans of a text by ``(paragraph, sentence)``, tokenized on demand."""
+
+    def __init__(self, paragraphs: Iterable[Tuple[int, int]], read_slice: Callable[[int, int], str]):
+        self.read_slice = read_slice
+        self.paragraphs: List[Tuple[int, int]] = []
+        self.ends: List[int] = []
+        self._pending = iter(paragraphs)
+        self._sentences: Dict[int, List[Tuple[int, int]]] = {}
+        self.lock = threading.RLock()
+
+    def _has_paragraph(self, number: int) -> bool:
+        while len(self.paragraphs) <= number:
+            span = next(self._pending, None)
+            if span is None:
+                return False
+            self.paragraphs.append(span)
+            self.ends.append(span[1])
+        return True
+
+    def _sentences_of(self, number: int) -> List[Tuple[int, int]]:
+        spans = self._sentences.get(number)
+        if spans is None:
+            start, end = self.paragraphs[number]
+            spans = sentence_spans(self.read_slice(start, end), start) or [(start, end)]
+            self._sentences[number] = spans
+        return spans
+
+    def locate(self, position: int) -> Tuple[int, int] | None:
+        """Ordinal of the first sentence ending after ``position``; None past the end."""
+
+        with self.lock:
+            while not self.ends or self.ends[-1] <= position:
+                if not self._has_paragraph(len(self.paragraphs)):
+                    return None
+            number = bisect_right(self.ends, position)
+            sentences = self._sentences_of(number)
+            for sentence, span in enumerate(sentences):
+                if span[1] > position:
+                    return number, sentence
+            return self.move((number, len(sentences) - 1), 1)
+
+    def move(self, ordinal: Tuple[int, int], step: int) -> Tuple[int, int] | None:
+        """Ordinal ``step`` sentences from ``ordinal``, stopping at the first; None past the last."""
+
+        with self.lock:
+            paragraph, sentence = ordinal[0], ordinal[1] + step
+            while sentence < 0:
+                if paragraph == 0:
+                    return 0, 0
+                paragraph -= 1
+                sentence += len(self._sentences_of(paragraph))
+            while self._has_paragraph(paragraph):
+                count = len(self._sentences_of(paragraph))
+                if sentence < count:
+                    return paragraph, sentence
+                sentence -= count
+                paragraph += 1
+            return None
+
+    def sentences_from(self, position: int, step: int = 0):
+        """Yield the spans from ``step`` sentences after the sentence at ``position`` to the end."""
+
+        ordinal = self.locate(position)
+        if ordinal is not None:
+            ordinal = self.move(ordinal, step)
+        while ordinal is not None:
+            with self.lock:
+                span = self._sentences_of(ordinal[0])[ordinal[1]]
+            yield span
+            ordinal = self.move(ordinal, 1)
+
+
+class PlaybackChannel:
+    """A reserved mixer channel for reading, with blocking waits instead of polling."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.channel = None
+        self.ends_at: float | None = None
+        self.remaining = 0.0
+        self.length = 0.0
+        self.queued_length: float | None = None
+        self.paused = False
+
+    def _channel(self):
+        ensure_mixer()
+        if self.channel is None:
+            pygame.mixer.set_reserved(1)
+            self.channel = pygame.mixer.Channel(0)
+        return self.channel
+
+    def play(self, sound, stop: threading.Event | None = None) -> bool:
+        with self.condition:
+            if stop is not None and stop.is_set():
+                return False
+            channel = self._channel()
+            channel.play(sound)
+            self.length = sound.get_length()
+            if self.paused:
+                channel.pause()
+                self.remaining = sound.get_length()
+                self.ends_at = None
+            else:
+                self.ends_at = time.monotonic() + sound.get_length()
+            self.condition.notify_all()
+            return True
+
+    def enqueue(self, sound, stop: threading.Event | None = None) -> bool:
+        """Queue ``sound`` after the current clip; return False if it started at once instead."""
+
+        with self.condition:
+            if stop is not None and stop.is_set():
+                return False
+            idle = self.ends_at is None and not self.remaining
+            if idle or not self._channel().get_busy():
+                self.play(sound, stop)
+                return False
+            self.channel.queue(sound)
+            self.queued_length = sound.get_length()
+            return True
+
+    def pause(self):
+        with self.condition:
+            if self.paused:
+                return
+            self.paused = True
+            if self.ends_at is not None:
+                self._channel().pause()
+                self.remaining = max(0.0, self.ends_at - time.monotonic())
+                self.ends_at = None
+            self.condition.notify_all()
+
+    def resume(self):
+        with self.condition:
+            if not self.paused:
+                return
+            self.paused = False
+            if self.remaining:
+                self._channel().unpause()
+                self.ends_at = time.monotonic() + self.remaining
+                self.remaining = 0.0
+            self.condition.notify_all()
+
+    def stop(self):
+        with self.condition:
+            if self.channel is not None:
+                self.channel.stop()
+            self.ends_at = None
+            self.remaining = 0.0
+            self.queued_length = None
+            self.paused = False
+            self.condition.notify_all()
+
+    def elapsed(self) -> float:
+        """Seconds played of the current clip."""
+
+        with self.condition:
+            if self.ends_at is not None:
+                return max(0.0, self.length - (self.ends_at - time.monotonic()))
+            return self.length - self.remaining
+
+    def wait(self):
+        """Block until the current clip has finished or playback is stopped.
+
+        If a clip was queued, it is now playing and becomes the current clip.
+        """
+
+        with self.condition:
+            while self.ends_at is not None or self.remaining:
+                if self.ends_at is None:
+                    self.condition.wait()
+                    continue
+                delay = self.ends_at - time.monotonic()
+                if delay > 0:
+                    self.condition.wait(delay)
+                elif self.queued_length is not None:
+                    self.ends_at += self.queued_length
+                    self.length = self.queued_length
+                    self.queued_length = None
+                    return
+                elif self.channel.get_busy():
+                    self.condition.wait(0.01)
+                else:
+                    self.ends_at = None
+
+
+class SessionJournal:
+    """Autosave of the session as an append-only ``journal.jsonl`` plus ``snapshot.json``.
+
+    The previous run is replayed into ``previous.json``; ``crashed`` is True if it did not ``close``.
+    """
+
+    SNAPSHOT_NAME = "snapshot.json"
+    JOURNAL_NAME = "journal.jsonl"
+    PREVIOUS_NAME = "previous.json"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_NAME)
+        self.journal_path = os.path.join(directory, self.JOURNAL_NAME)
+        self.previous_path = os.path.join(directory, self.PREVIOUS_NAME)
+        self.lock = threading.Lock()
+        self.compacting = threading.Lock()
+        self.wake = threading.Event()
+        self.enabled = True
+        self.started = False
+        self.handle = None
+        self.state = self.empty_state()
+        self.seq = 0
+        self.pending = 0
+        self.tail: List[str] | None = None
+        state, clean = self._replay()
+        self.crashed = not clean and bool(state["entries"])
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if state["entries"] or state["text_path"] or state.get("text_content") or state.get("text_digest"):
+                self._write(self.previous_path, self._session_file(state))
+        except OSError as exc:
+            self._disable(exc)
+
+    @staticmethod
+    def empty_state() -> Dict:
+        return {"text_path": None, "text_digest": None, "theme": "light", "font_size": DEFAULT_FONT_SIZE, "entries": {}}
+
+    def _text_path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"text-{digest}.txt")
+
+    def _session_file(self, state: Dict) -> Dict:
+        data = {key: value for key, value in state.items() if key not in ("entries", "text_digest")}
+        if state.get("text_digest"):
+            try:
+                with open(self._text_path(state["text_digest"]), "r", encoding="utf-8") as handle:
+                    data["text_content"] = handle.read()
+            except OSError:
+                data["text_content"] = ""
+        data["created_at"] = current_iso()
+        data["entries"] = list(state["entries"].values())
+        return data
+
+    @staticmethod
+    def _apply(state: Dict, record: Dict) -> Dict:
+        op = record["op"]
+        if op == "put":
+            state["entries"][record["key"]] = record["entry"]
+        elif op == "delete":
+            state["entries"].pop(record["key"], None)
+        elif op == "settings":
+            state.update(theme=record["theme"], font_size=record["font_size"])
+        elif op == "reset":
+            state = record["session"]
+        return state
+
+    def _replay(self) -> Tuple[Dict, bool]:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as handle:
+                snapshot = json.load(handle)
+            state, seq, clean = snapshot["session"], snapshot["seq"], snapshot["clean"]
+        except (OSError, ValueError, KeyError):
+            state, seq, clean = self.empty_state(), 0, True
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # a line cut short by the crash
+                    if record["seq"] > seq:
+                        state = self._apply(state, record)
+                        seq = record["seq"]
+                        clean = False
+        except OSError:
+            pass
+        return state, clean
+
+    def _disable(self, exc: OSError):
+        log.warning("Session autosave disabled: %s", exc)
+        self.enabled = False
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except OSError:
+                pass
+            self.handle = None
+
+    def start(self):
+        """Replace the previous run's snapshot and journal with the new session's."""
+
+        with self.lock:
+            self._start()
+
+    def _start(self):
+        if self.started or not self.enabled:
+            return
+        self.started = True
+        try:
+            self._write(self.snapshot_path, {"seq": 0, "clean": False, "session": self.state})
+            self.handle = open(self.journal_path, "w", encoding="utf-8")
+        except OSError as exc:
+            self._disable(exc)
+            return
+        threading.Thread(target=self._compactor, name="session-journal", daemon=True).start()
+
+    def append(self, record: Dict):
+        with self.lock:
+            full = self._append(record)
+        if full:
+            self.wake.set()
+
+    def _append(self, record: Dict) -> bool:
+        self._start()
+        if not self.enabled:
+            return False
+        self.seq += 1
+        record["seq"] = self.seq
+        self.state = self._apply(self.state, record)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            self.handle.write(line)
+            self.handle.flush()
+        except OSError as exc:
+            self._disable(exc)
+            return False
+        if self.tail is not None:
+            self.tail.append(line)
+        self.pending += 1
+        return self.pending >= JOURNAL_COMPACT_RECORDS
+
+    def reset(self, session: Dict):
+        """Start a new session; its ``text_content`` is stored once, by digest."""
+
+        session = dict(session)
+        content = session.pop("text_content", "")
+        session["text_digest"] = text_digest(content) if content else None
+        with self.lock:
+            text_file = self._text_path(session["text_digest"]) if content else None
+            if text_file and self.enabled and not os.path.exists(text_file):
+                try:
+                    with open(text_file + ".tmp", "w", encoding="utf-8") as handle:
+                        handle.write(content)
+                    os.replace(text_file + ".tmp", text_file)
+                except OSError as exc:
+                    self._disable(exc)
+            self._append({"op": "reset", "session": session})
+        self.wake.set()
+
+    def _compactor(self):
+        while self.enabled:
+            self.wake.wait(JOURNAL_COMPACT_S)
+            self.wake.clear()
+            self.compact()
+
+    def compact(self, clean: bool = False):
+        """Write the state to the snapshot and keep only the journal lines appended meanwhile."""
+
+        with self.compacting:
+            with self.lock:
+                if not self.started or not self.enabled or (not self.pending and not clean):
+                    return
+                state = dict(self.state, entries=dict(self.state["entries"]))
+                seq = self.seq
+                self.pending = 0
+                self.tail = []
+            try:
+                self._write(self.snapshot_path, {"seq": seq, "clean": clean, "session": state})
+                with self.lock:
+                    if not self.enabled:
+                        return
+                    self.handle.close()
+                    with open(self.journal_path + ".tmp", "w", encoding="utf-8") as handle:
+                        handle.writelines(self.tail)
+                    os.replace(self.journal_path + ".tmp", self.journal_path)
+                    self.handle = open(self.journal_path, "a", encoding="utf-8")
+                    self.tail = None
+                    self._prune_texts(self.state.get("text_digest"))
+            except OSError as exc:
+                with self.lock:
+                    self._disable(exc)
+
+    def _prune_texts(self, keep: str | None):
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith("text-") and entry.name != f"text-{keep}.txt":
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def close(self):
+        self.compact(clean=True)
+
+    @staticmethod
+    def _write(path: str, data: Dict):
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump(data, handle, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+
 class VocabReaderApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -65,21 +1782,59 @@ class VocabReaderApp(tk.Tk):
         self.font_size = DEFAULT_FONT_SIZE
         self.text_path = None
         self.text_content = ""
+        self.document: PagedDocument | None = None
+        self.page_base = 0
+        self._page_span: Tuple[int, int] = (0, 0)
+        self._page_job: str | None = None
+        self._page_pinned = False
+        self._reading_range: Tuple[int, int] | None = None
+        self._restore_generation = 0
+        self._restoring = False
         self.sentences_cache: List[Tuple[int, int]] = []
+        self._line_starts: List[int] = [0]  # of the shown page; entry offsets assume it is not edited
         self.entries: Dict[str, WordEntry] = {}
+        self.entry_index = OrderedEntryIndex()
+        self.search_index = EntrySearchIndex()
         self.llm_cache: Dict[str, Dict] = {}
+        self.translation_cache: Dict[str, Dict] = {}
+        self.vi_alignment: List[Tuple[int, int, int, int]] = []
+        self._vi_alignment_starts: List[int] = []
         self.tts = api.TTSManager(cache_dir=CACHE_DIR, lang="en", tld="com")
+        self.audio_cache = AudioCache(self.tts, CACHE_DIR)
+        self.prefetcher = SpeechPrefetcher(self.audio_cache)
+        self.entry_audio = BackgroundSynthesizer(self.audio_cache, self.prefetcher.idle)
+        # One worker: NLTK's lazy corpus loading and downloads are not thread-safe.
+        self.word_info_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="word-info")
+        self.playback = PlaybackChannel()
+        self.sounds = SoundCache()
+        self.journal = SessionJournal(SESSION_DIR)
+        self.ui = UICommandQueue(self)
+        self.rendered: RenderedAudio | None = None
+        self._render_cancel: threading.Event | None = None
+        self._render_thread: threading.Thread | None = None
+        self._rendered_job: str | None = None
+        self._rendered_segment: int | None = None
+        self._word_timer: str | None = None
+        self._word_timings: List[Tuple[float, float, int, int]] = []
+        self._word_starts: List[float] = []
+        self._word_base = 0
+        self._word_index = -1
+        self._translations_running: set = set()
         self._reading_thread = None
         self._reading_stop = threading.Event()
         self._reading_pause = threading.Event()
         self._reading_mode = None
+        self._reading_index: SentenceIndex | None = None
+        self._reading_anchor: Tuple[int, int] | None = None
+        self.reading_speed = 1.0
+        self.speed_var = tk.StringVar(value=self._speed_label(1.0))
         self.lemmatizer = WordNetLemmatizer()
         self.entry_marks_en: Dict[str, Dict[str, str]] = {}
         self.entry_marks_vi: Dict[str, Dict[str, str]] = {}
-        self.number_widgets_en: Dict[str, Dict[str, object]] = {}
-        self.number_widgets_vi: Dict[str, Dict[str, object]] = {}
         self._suppress_lemma_speak = False
         self._pending_context_item = None
+        self._font_job: str | None = None
+        self._preview_font_size = self.font_size
         self._tree_cell_tag_supported: bool | None = None
         self._tree_cell_tags: Dict[str, str] = {}
         self._active_tree_item: str | None = None
@@ -88,6 +1843,11 @@ class VocabReaderApp(tk.Tk):
         self._build_ui()
         self._bind_keys()
         self._apply_theme()
+        self.protocol("WM_DELETE_WINDOW", self.action_exit)
+        if self.journal.crashed:
+            self.after_idle(self._offer_recovery)
+        else:
+            self.journal.start()
 
     def _build_ui(self):
         self.style = ttk.Style(self)
@@ -103,12 +1863,27 @@ class VocabReaderApp(tk.Tk):
         ttk.Button(toolbar, text="Read Paragraph", command=lambda: self.start_reading("paragraph")).pack(side="left", padx=4)
         ttk.Button(toolbar, text="Read Sentence", command=lambda: self.start_reading("sentence")).pack(side="left", padx=4)
         ttk.Button(toolbar, text="Read Word", command=lambda: self.start_reading("word")).pack(side="left", padx=4)
+        ttk.Button(toolbar, text="Read from Caret", command=lambda: self.start_reading("continuous")).pack(side="left", padx=4)
         self.btn_pause = ttk.Button(toolbar, text="Pause", command=self.toggle_pause, state="disabled")
         self.btn_pause.pack(side="left", padx=4)
+        self.btn_stop = ttk.Button(toolbar, text="Stop", command=self.stop_reading, state="disabled")
+        self.btn_stop.pack(side="left", padx=4)
+        ttk.Label(toolbar, text="Speed:").pack(side="left", padx=(8, 2))
+        speed_box = ttk.Combobox(
+            toolbar,
+            textvariable=self.speed_var,
+            values=[self._speed_label(speed) for speed in READING_SPEEDS],
+            state="readonly",
+            width=6,
+        )
+        speed_box.pack(side="left", padx=4)
+        speed_box.bind("<<ComboboxSelected>>", lambda _: self.set_reading_speed())
         ttk.Separator(toolbar, orient="vertical").pack(side="left", fill="y", padx=6)
         ttk.Label(toolbar, text="Font:").pack(side="left", padx=(12, 2))
         self.font_slider = ttk.Scale(toolbar, from_=MIN_FONT, to=MAX_FONT, value=self.font_size, command=self.on_change_font)
         self.font_slider.pack(side="left", padx=4)
+        self.progress = ttk.Progressbar(toolbar, length=160, mode="determinate", maximum=1.0)
+        self.progress_label = ttk.Label(toolbar, text="")
         paned = ttk.PanedWindow(self, orient="horizontal")
         paned.pack(fill="both", expand=True)
         left = ttk.Frame(paned)
@@ -124,9 +1899,15 @@ class VocabReaderApp(tk.Tk):
         self.text_en.config(selectbackground="#5dade2", selectforeground="#000000")
         en_scrollbar = ttk.Scrollbar(en_wrap, orient="vertical", command=self.text_en.yview)
         en_scrollbar.pack(side="right", fill="y")
-        self.text_en.configure(yscrollcommand=en_scrollbar.set)
+        self.text_en.configure(yscrollcommand=lambda *args: self._on_text_scroll(self.bubbles_en, en_scrollbar, *args))
+        # A page loaded by reading stays put until the user scrolls (see _check_page_swap).
+        for sequence in ("<KeyPress>", "<ButtonPress>", "<MouseWheel>"):
+            self.text_en.bind(sequence, self._unpin_page, add="+")
+        en_scrollbar.bind("<ButtonPress>", self._unpin_page, add="+")
         self.text_en.tag_configure("word_highlight", background=HIGHLIGHT_COLOR)
         self.text_en.tag_configure("reading", background="#ffd000")
+        self.text_en.tag_configure("reading_word", background="#ff9f1a")
+        self.text_en.tag_raise("reading_word", "reading")
         self.tab_vi = ttk.Frame(self.nb_left)
         self.nb_left.add(self.tab_vi, text="Viet-sub")
         vi_wrap = ttk.Frame(self.tab_vi)
@@ -136,9 +1917,17 @@ class VocabReaderApp(tk.Tk):
         self.text_vi.config(selectbackground="#5dade2", selectforeground="#000000")
         vi_scroll = ttk.Scrollbar(vi_wrap, orient="vertical", command=self.text_vi.yview)
         vi_scroll.pack(side="right", fill="y")
-        self.text_vi.configure(yscrollcommand=vi_scroll.set)
+        self.text_vi.configure(yscrollcommand=lambda *args: self._on_text_scroll(self.bubbles_vi, vi_scroll, *args))
         self.text_vi.tag_configure("word_highlight", background=HIGHLIGHT_COLOR)
         self.text_vi.tag_configure("reading", background="#ffd000")
+        self.font_metrics = FontMetricsCache(self)
+        size = self._bubble_font_size()
+        self.bubble_font = tkfont.Font(self, family="Segoe UI", size=size, weight="bold")
+        height = self.font_metrics.get("Segoe UI", size, "bold")[0]
+        self.bubbles_en = NumberBubbleOverlay(
+            self.text_en, self.bubble_font, height, self._entry_number, self._entry_keys_between
+        )
+        self.bubbles_vi = NumberBubbleOverlay(self.text_vi, self.bubble_font, height, self._entry_number)
         self.cm = tk.Menu(self, tearoff=0)
         self.cm.add_command(label="Đánh dấu từ mới (Alt+D)", command=self.mark_new_word)
         self.cm.add_command(label="Phát âm", command=self.speak_selection)
@@ -151,14 +1940,29 @@ class VocabReaderApp(tk.Tk):
         self.tab_dict = ttk.Frame(self.nb_right)
         self.nb_right.add(self.tab_dict, text="Từ điển cá nhân")
         cols = ("No.", "Word", "POS", "Meaning (VI)")
-        self.tree = ttk.Treeview(self.tab_dict, columns=cols, show="headings")
+        search_bar = ttk.Frame(self.tab_dict)
+        search_bar.pack(fill="x")
+        ttk.Label(search_bar, text="Tìm:").pack(side="left", padx=(4, 2), pady=4)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_bar, textvariable=self.search_var)
+        search_entry.pack(side="left", fill="x", expand=True, padx=(0, 4))
+        search_entry.bind("<Escape>", lambda _event: self.search_var.set(""))
+        self.search_var.trace_add("write", lambda *_args: self._apply_search())
+        tree_wrap = ttk.Frame(self.tab_dict)
+        tree_wrap.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(tree_wrap, columns=cols, show="headings", selectmode="browse")
         for col in cols:
             self.tree.heading(col, text=col)
         self.tree.column("No.", width=60, anchor="center")
         self.tree.column("Word", width=220, anchor="w")
         self.tree.column("POS", width=120, anchor="w")
         self.tree.column("Meaning (VI)", width=520, anchor="w")
-        self.tree.pack(fill="both", expand=True)
+        self.tree.pack(side="left", fill="both", expand=True)
+        tree_scroll = ttk.Scrollbar(tree_wrap, orient="vertical")
+        tree_scroll.pack(side="right", fill="y")
+        self.dict_table = VirtualEntryTable(
+            self.tree, tree_scroll, self.entry_index, self._tree_row_values, self._submit_entry_audio
+        )
         self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         self.tree.bind("<ButtonPress-1>", self._on_tree_button_press)
         self.tree.bind("<ButtonRelease-1>", self._on_tree_button_release)
@@ -175,16 +1979,30 @@ class VocabReaderApp(tk.Tk):
         file_menu.add_command(label="Open .txt", command=self.action_open_txt, accelerator="Ctrl+O")
         file_menu.add_command(label="Save Session (JSON)", command=self.action_save_session, accelerator="Ctrl+S")
         file_menu.add_command(label="Load Session (JSON)", command=self.action_load_session)
+        file_menu.add_command(label="Recover Last Session", command=self.action_recover_session)
         file_menu.add_separator()
         file_menu.add_command(label="Export TXT", command=self.action_export_txt, accelerator="Ctrl+E")
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.destroy)
+        file_menu.add_command(label="Exit", command=self.action_exit)
         menu_root.add_cascade(label="File", menu=file_menu)
         tools_menu = tk.Menu(menu_root, tearoff=0)
         tools_menu.add_command(label="Read Paragraph", command=lambda: self.start_reading("paragraph"), accelerator="Ctrl+P")
         tools_menu.add_command(label="Read Sentence", command=lambda: self.start_reading("sentence"), accelerator="Ctrl+Shift+S")
         tools_menu.add_command(label="Read Word", command=lambda: self.start_reading("word"), accelerator="Ctrl+W")
+        tools_menu.add_command(label="Read from Caret", command=lambda: self.start_reading("continuous"), accelerator="Ctrl+R")
         tools_menu.add_command(label="Pause/Resume", command=self.toggle_pause, accelerator="Space")
+        tools_menu.add_command(label="Previous Sentence", command=lambda: self.seek_sentence(-1), accelerator="Alt+Left")
+        tools_menu.add_command(label="Next Sentence", command=lambda: self.seek_sentence(1), accelerator="Alt+Right")
+        speed_menu = tk.Menu(tools_menu, tearoff=0)
+        for speed in READING_SPEEDS:
+            label = self._speed_label(speed)
+            speed_menu.add_radiobutton(label=label, value=label, variable=self.speed_var, command=self.set_reading_speed)
+        tools_menu.add_cascade(label="Reading Speed", menu=speed_menu)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Render Document Audio", command=self.render_document_audio)
+        tools_menu.add_command(label="Play Rendered Audio", command=self.play_rendered_audio)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Diagnostics", command=self.show_diagnostics)
         menu_root.add_cascade(label="Tools", menu=tools_menu)
         help_menu = tk.Menu(menu_root, tearoff=0)
         help_menu.add_command(label="About", command=lambda: messagebox.showinfo("About", APP_TITLE))
@@ -199,6 +2017,9 @@ class VocabReaderApp(tk.Tk):
         self.bind("<Control-p>", lambda _: self.start_reading("paragraph"))
         self.bind("<Control-Shift-S>", lambda _: self.start_reading("sentence"))
         self.bind("<Control-w>", lambda _: self.start_reading("word"))
+        self.bind("<Control-r>", lambda _: self.start_reading("continuous"))
+        self.bind("<Alt-Left>", lambda _: self.seek_sentence(-1))
+        self.bind("<Alt-Right>", lambda _: self.seek_sentence(1))
         self.bind("<space>", lambda _: self.toggle_pause())
 
     def _apply_theme(self):
@@ -242,41 +2063,132 @@ class VocabReaderApp(tk.Tk):
         path = filedialog.askopenfilename(filetypes=[("UTF-8 Text", "*.txt"), ("All files", "*.*")])
         if not path:
             return
-        with open(path, "r", encoding="utf-8") as handle:
-            raw = handle.read()
+        self.stop_reading()
+        self._restore_generation += 1
+        self._restoring = False
+        self._hide_progress()
         self.text_path = path
-        self.text_content = raw
-        self._render_text_en(raw)
-        self._build_sentence_offsets(raw)
+        self._show_document(path, None)
         self.entries.clear()
         self.llm_cache.clear()
         self.entry_marks_en.clear()
         self.entry_marks_vi.clear()
-        self._clear_number_widgets(self.text_en, self.number_widgets_en)
-        self._clear_number_widgets(self.text_vi, self.number_widgets_vi)
-        self.tree.delete(*self.tree.get_children())
+        self.bubbles_en.clear()
+        self.bubbles_vi.clear()
+        self.entry_index.clear()
+        self.search_index = EntrySearchIndex()
+        self.entry_audio.clear()
+        self.journal.reset(self._journal_session())
+        self._reset_tree_view()
         self.title(f"{APP_TITLE} – {os.path.basename(path)}")
         self.text_vi.delete("1.0", "end")
+        self._set_vi_alignment([])
         self._clear_vietsub_state()
 
+    def _show_document(self, path: str | None, content: str | None):
+        """Show ``content``, or page the file at ``path`` when it is too large to load."""
+
+        if self.document is not None:
+            self._retire_document(self.document)
+            self.document = None
+        self.page_base = 0
+        self._reading_range = None
+        if content is None and path and os.path.getsize(path) > PAGED_VIEW_THRESHOLD:
+            self.text_content = ""
+            self.document = PagedDocument(path)
+            self._page_span = (0, 0)
+            self._load_page_around(0)
+            return
+        if content is None:
+            with open(path, "r", encoding="utf-8") as handle:
+                content = handle.read()
+        self.text_content = content
+        self._render_text_en(content)
+        self._build_sentence_offsets(content)
+
+    def _retire_document(self, document: PagedDocument):
+        """Close ``document`` once the reading and render threads that may still slice it have ended."""
+
+        busy = [thread for thread in (self._reading_thread, self._render_thread) if thread is not None and thread.is_alive()]
+        if not busy:
+            document.close()
+            return
+
+        def close_when_done():
+            for thread in busy:
+                thread.join()
+            document.close()
+
+        threading.Thread(target=close_when_done, daemon=True).start()
+
     def _render_text_en(self, content: str):
         self.text_en.configure(state="normal")
         self.text_en.delete("1.0", "end")
         self.text_en.insert("1.0", content)
+        self._line_starts = line_start_offsets(content)
+        self.text_en.edit_reset()
         self.text_en.see("1.0")
 
-    def _build_sentence_offsets(self, content: str):
-        self.sentences_cache.clear()
-        index = 0
-        for sentence in sent_tokenize(content):
-            start = content.find(sentence, index)
-            if start == -1:
-                start = index
-            end = start + len(sentence)
-            self.sentences_cache.append((start, end))
-            index = end
+    def _build_sentence_offsets(self, content: str, base: int = 0):
+        self.sentences_cache[:] = sentence_spans(content, base)
+
+    def _load_page_around(self, offset: int) -> bool:
+        """Show the page around ``offset`` scrolled to it; page swaps wait for the user to scroll."""
+
+        doc = self.document
+        first, last = doc.window_around(offset, PAGE_CHARS)
+        if (first, last) == self._page_span:
+            return False
+        content = doc.text(first, last)
+        self._page_span = (first, last)
+        self.page_base = doc.starts[first]
+        self._render_text_en(content)
+        self.text_en.see(self._abs_to_index(offset))
+        self._page_pinned = True
+        self._build_sentence_offsets(content, self.page_base)
+        self._reapply_highlights_en()
+        if self._reading_range:
+            self._highlight_range(*self._reading_range)
+        if self.text_vi.get("1.0", "end-1c").strip():
+            self.text_vi.delete("1.0", "end")
+            self._set_vi_alignment([])
+            self._clear_vietsub_state()
+        return True
+
+    def _check_page_swap(self, first: float, last: float):
+        self._page_job = None
+        if self.document is None or self._page_pinned:
+            return
+        page_first, page_last = self._page_span
+        at_end = last >= 1 - PAGE_EDGE and page_last < len(self.document)
+        at_start = first <= PAGE_EDGE and page_first > 0
+        if not (at_end or at_start):
+            return
+        anchor = self._index_to_abs_pos(self.text_en.index("@0,0"))
+        if self._load_page_around(anchor):
+            self.text_en.yview(self._abs_to_index(anchor))
+            self._page_pinned = False
+
+    def _unpin_page(self, _event=None):
+        self._page_pinned = False
+
+    def _page_bounds(self) -> Tuple[float, float]:
+        if self.document is None:
+            return 0, float("inf")
+        last = self._page_span[1] - 1
+        return self.page_base, self.document.starts[last] + self.document.lengths[last]
+
+    def _page_contains(self, offset: int) -> bool:
+        start, end = self._page_bounds()
+        return start <= offset <= end
+
+    def _paragraph_spans(self):
+        if self.document is not None:
+            return self.document.iter_paragraph_spans()
+        return paragraph_spans(self.text_en.get("1.0", "end-1c"))
 
     def action_save_session(self):
+        # Paged documents are restored from text_path instead of being inlined.
         data = {
             "text_path": self.text_path,
             "text_content": self.text_content,
@@ -296,24 +2208,64 @@ class VocabReaderApp(tk.Tk):
         path = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
         if not path:
             return
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        self.text_content = data.get("text_content", "")
-        self._render_text_en(self.text_content)
-        self._build_sentence_offsets(self.text_content)
-        self.theme = data.get("theme", "light")
-        self.font_size = data.get("font_size", DEFAULT_FONT_SIZE)
-        self.font_slider.set(self.font_size)
-        self.text_en.config(font=("Segoe UI", self.font_size))
-        self.text_vi.config(font=("Segoe UI", self.font_size))
-        self._configure_tree_style()
-        self._apply_theme()
-        self.entries.clear()
-        self.entry_marks_en.clear()
-        self.entry_marks_vi.clear()
-        self._clear_number_widgets(self.text_en, self.number_widgets_en)
-        self._clear_number_widgets(self.text_vi, self.number_widgets_vi)
-        self.tree.delete(*self.tree.get_children())
+        self._load_session_file(path)
+
+    def action_recover_session(self):
+        """Load the session the previous run left in the autosave journal."""
+
+        if not os.path.exists(self.journal.previous_path):
+            messagebox.showinfo("Recover", "Không có phiên tự lưu nào.")
+            return
+        self._load_session_file(self.journal.previous_path)
+
+    def _offer_recovery(self):
+        # The old journal is replaced by the restored session's reset, or now if declined.
+        if messagebox.askyesno("Recover", "Lần trước ứng dụng bị đóng đột ngột. Khôi phục phiên học chưa lưu?"):
+            self._load_session_file(self.journal.previous_path)
+        else:
+            self.journal.start()
+
+    def action_exit(self):
+        self._cancel_render()
+        self.word_info_pool.shutdown(wait=False, cancel_futures=True)
+        self.journal.close()
+        self.destroy()
+
+    def _journal_session(self) -> Dict:
+        return {
+            "text_path": self.text_path,
+            "text_content": self.text_content,
+            "theme": self.theme,
+            "font_size": self.font_size,
+            "entries": {key: asdict(entry) for key, entry in self.entries.items()},
+        }
+
+    def _journal_settings(self):
+        self.journal.append({"op": "settings", "theme": self.theme, "font_size": self.font_size})
+
+    def _load_session_file(self, path: str):
+        self.stop_reading()
+        self._restore_generation += 1
+        generation = self._restore_generation
+        self._restoring = True
+        threading.Thread(target=self._parse_session_worker, args=(path, generation), daemon=True).start()
+        self._show_progress("Đang đọc phiên học…", 0.0)
+
+    def _parse_session_worker(self, path: str, generation: int):
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            entries = self._entries_from_session(data)
+            search_index = EntrySearchIndex()
+            for key, entry in entries:
+                search_index.add(key, entry)
+        except Exception as exc:
+            self.ui.post(self._session_parsed, generation, None, None, None, exc)
+            return
+        self.ui.post(self._session_parsed, generation, data, entries, search_index, None)
+
+    def _entries_from_session(self, data: Dict) -> List[Tuple[str, WordEntry]]:
+        entries: List[Tuple[str, WordEntry]] = []
         for entry_data in data.get("entries", []):
             offsets = entry_data.get("offsets") or []
             converted: List[Dict] = []
@@ -326,12 +2278,105 @@ class VocabReaderApp(tk.Tk):
             if "surface" not in entry_data:
                 entry_data["surface"] = ""
             entry = WordEntry(**entry_data)
-            key = self._entry_key(entry.display, entry.context_sentence)
-            self.entries[key] = entry
-        self._refresh_tree_sorted()
-        self._reapply_highlights_en()
+            entries.append((self._entry_key(entry.display, entry.context_sentence), entry))
+        return entries
+
+    def _session_parsed(self, generation: int, data, entries, search_index, error: Exception | None):
+        if generation != self._restore_generation:
+            return
+        if error is not None:
+            self._restoring = False
+            self._hide_progress()
+            messagebox.showerror("Load Session", str(error))
+            return
+        self._begin_session_restore(generation, data, entries, search_index)
+
+    def _begin_session_restore(
+        self, generation: int, data: Dict, entries: List[Tuple[str, WordEntry]], search_index: EntrySearchIndex
+    ):
+        self.entries.clear()
+        self.entry_index.clear()
+        self.search_index = search_index
         self.text_vi.delete("1.0", "end")
+        self._set_vi_alignment([])
         self._clear_vietsub_state()
+        self._reapply_highlights_en()
+        self.text_path = data.get("text_path")
+        content = data.get("text_content", "")
+        if not content and self.text_path and os.path.exists(self.text_path):
+            self._show_document(self.text_path, None)
+        else:
+            self._show_document(None, content)
+        self.theme = data.get("theme", "light")
+        self.font_size = data.get("font_size", DEFAULT_FONT_SIZE)
+        self._preview_font_size = self.font_size
+        self.font_slider.set(self.font_size)
+        self.text_en.config(font=("Segoe UI", self.font_size))
+        self.text_vi.config(font=("Segoe UI", self.font_size))
+        self._configure_tree_style()
+        self._apply_theme()
+        self._reset_tree_view()
+        self.update_idletasks()
+        # Entries are inserted slice by slice too: the visible ones, then the
+        # rest of the page, then those on other pages.
+        visible_start = self._index_to_abs_pos(self.text_en.index("@0,0"))
+        visible_end = self._index_to_abs_pos(self.text_en.index(f"@0,{self.text_en.winfo_height()} lineend"))
+        page_start, page_end = self._page_bounds()
+        tiers: Tuple[List, List, List] = ([], [], [])
+        for key, entry in entries:
+            start = self._entry_sort_key(entry)[0]
+            tier = 0 if visible_start <= start <= visible_end else 1 if page_start <= start <= page_end else 2
+            tiers[tier].append((key, entry))
+        job = {"entries": tiers[0] + tiers[1] + tiers[2], "done": 0}
+        self._show_progress("Đang khôi phục phiên học…", 0.0)
+        self.after_idle(self._restore_step, generation, job)
+
+    def _restore_step(self, generation: int, job: Dict):
+        """Insert and highlight one time slice of a session restore's entries, visible ones first."""
+
+        if generation != self._restore_generation:
+            return
+        deadline = time.perf_counter() + RESTORE_SLICE_MS / 1000
+        pending: List[Tuple[str, WordEntry]] = job["entries"]
+        batch = HighlightBatch(self.text_en, self._line_starts)
+        while job["done"] < len(pending) and time.perf_counter() < deadline:
+            for key, entry in pending[job["done"] : job["done"] + 50]:
+                self._store_entry(key, entry)
+                self._apply_entry_highlight(key, entry, batch)
+            job["done"] = min(len(pending), job["done"] + 50)
+        batch.apply()
+        self._refresh_dict_table()
+        self._update_entry_numbers()
+        if job["done"] < len(pending):
+            self._show_progress("Đang khôi phục phiên học…", job["done"] / len(pending))
+            self.after(1, self._restore_step, generation, job)
+            return
+        self._restoring = False
+        self.journal.reset(self._journal_session())
+        self._apply_search()
+        self._hide_progress()
+        self.entry_audio.clear()
+        # Words in view first, then every entry in text order as the low-priority backlog.
+        last = self.text_en.index(f"@0,{self.text_en.winfo_height()} lineend")
+        self._submit_entry_audio(self._entry_keys_between(self.text_en.index("@0,0"), last))
+        self.entry_audio.submit_backlog(
+            [text for key in self.entry_index for text in (self.entries[key].display, self.entries[key].surface)]
+        )
+
+    def _submit_entry_audio(self, keys: Iterable[str]):
+        entries = [self.entries[key] for key in keys if key in self.entries]
+        self.entry_audio.submit([text for entry in entries for text in (entry.display, entry.surface)], first=True)
+
+    def _show_progress(self, text: str, fraction: float):
+        if not self.progress.winfo_ismapped():
+            self.progress.pack(side="right", padx=6)
+            self.progress_label.pack(side="right")
+        self.progress_label.config(text=text)
+        self.progress["value"] = fraction
+
+    def _hide_progress(self):
+        self.progress.pack_forget()
+        self.progress_label.pack_forget()
 
     def action_export_txt(self):
         if not self.entries:
@@ -354,6 +2399,9 @@ class VocabReaderApp(tk.Tk):
             self.cm.grab_release()
 
     def mark_new_word(self):
+        if self._restoring:
+            messagebox.showinfo("Đánh dấu", "Đang khôi phục phiên học, vui lòng chờ.")
+            return
         try:
             start_index = self.text_en.index("sel.first")
             end_index = self.text_en.index("sel.last")
@@ -367,11 +2415,27 @@ class VocabReaderApp(tk.Tk):
         selection = self.text_en.get(trimmed_start, trimmed_end)
         if not selection.strip():
             return
-        full_text = self.text_en.get("1.0", "end-1c")
-        abs_start = self._index_to_abs_pos(trimmed_start, full_text)
-        abs_end = self._index_to_abs_pos(trimmed_end, full_text)
-        paragraph = self._find_paragraph(full_text, abs_start, abs_end)
-        word_info = self._fetch_word_info(selection, paragraph)
+        page_text = self.text_en.get("1.0", "end-1c")
+        abs_start = self._index_to_abs_pos(trimmed_start)
+        abs_end = self._index_to_abs_pos(trimmed_end)
+        paragraph = self._find_paragraph(page_text, abs_start - self.page_base, abs_end - self.page_base)
+        self.word_info_pool.submit(self._word_info_worker, selection, paragraph, abs_start, abs_end, self._restore_generation)
+
+    def _word_info_worker(self, selection: str, paragraph: str, abs_start: int, abs_end: int, generation: int):
+        """Look up the dictionary and LLM data for a marked word off the Tk thread."""
+
+        try:
+            word_info = self._fetch_word_info(selection, paragraph)
+        except Exception as exc:
+            self.ui.post(messagebox.showerror, "Đánh dấu", str(exc))
+            return
+        self.ui.post(self._finish_mark_new_word, selection, paragraph, abs_start, abs_end, generation, word_info)
+
+    def _finish_mark_new_word(
+        self, selection: str, paragraph: str, abs_start: int, abs_end: int, generation: int, word_info: Dict[str, str]
+    ):
+        if generation != self._restore_generation or self._restoring:
+            return  # another document or session was opened meanwhile
         entry_key = self._entry_key(word_info["lemma"], paragraph)
         entry = WordEntry(
             display=word_info["lemma"],
@@ -385,18 +2449,26 @@ class VocabReaderApp(tk.Tk):
             added_at=current_iso(),
             surface=selection,
         )
-        self.entries[entry_key] = entry
+        previous = self.entries.pop(entry_key, None)
+        changed_rank = None
+        if previous is not None:
+            self._remove_entry_highlight(entry_key, previous)
+            changed_rank = self.entry_index.discard(entry_key)
+        rank = self._store_entry(entry_key, entry)
+        self.search_index.add(entry_key, entry)
+        self.journal.append({"op": "put", "key": entry_key, "entry": asdict(entry)})
         self._apply_entry_highlight(entry_key, entry)
-        self._refresh_tree_sorted()
+        self._refresh_dict_table()
         if not self.text_vi.get("1.0", "end-1c").strip():
             self.translate_full_text()
         else:
             self._update_vietsub_highlights()
-        self._update_entry_numbers()
+        self._update_entry_numbers(rank if changed_rank is None else min(rank, changed_rank))
         try:
-            self.tts.speak(selection)
+            self._speak_cached(selection)
         except Exception as exc:
             messagebox.showerror("TTS", str(exc))
+        self.entry_audio.submit([entry.display], first=True)
 
     def speak_selection(self):
         try:
@@ -406,7 +2478,7 @@ class VocabReaderApp(tk.Tk):
             snippet = self.text_en.get(idx, "insert wordend").strip()
         if snippet:
             try:
-                self.tts.speak(snippet)
+                self._speak_cached(snippet)
             except Exception as exc:
                 messagebox.showerror("TTS", str(exc))
 
@@ -414,88 +2486,374 @@ class VocabReaderApp(tk.Tk):
         if self._reading_thread and self._reading_thread.is_alive():
             messagebox.showinfo("Reading", "Đang đọc. Hãy Pause/Resume hoặc chờ xong.")
             return
+        read_slice = self._reading_source()
+        index = SentenceIndex(self._paragraph_spans(), read_slice)
+        anchor = None
+        if mode == "paragraph":
+            chunks = index.sentences_from(0)
+        elif mode == "continuous":
+            anchor = (self._index_to_abs_pos(self.text_en.index("insert")), 0)
+            chunks = index.sentences_from(*anchor)
+        elif mode == "sentence":
+            span = self._get_current_sentence()
+            chunks = iter([span] if span else [])
+        else:
+            try:
+                start, end = self.text_en.index("sel.first"), self.text_en.index("sel.last")
+            except tk.TclError:
+                start, end = self.text_en.index("insert wordstart"), self.text_en.index("insert wordend")
+            chunks = iter([(self._index_to_abs_pos(start), self._index_to_abs_pos(end))])
+        self._launch_reading(mode, chunks, read_slice, index, anchor)
+
+    def _launch_reading(
+        self,
+        mode: str,
+        chunks,
+        read_slice: Callable[[int, int], str],
+        index: SentenceIndex,
+        anchor: Tuple[int, int] | None,
+    ):
+        # Every run gets its own stop event, so a run being replaced by a seek
+        # cannot stop, highlight or clean up after the run that replaces it.
         self._reading_mode = mode
-        self._reading_stop.clear()
+        self._reading_stop = threading.Event()
         self._reading_pause.clear()
+        self._reading_index = index
+        self._reading_anchor = anchor
+        self.playback.resume()
         self.btn_pause.config(state="normal", text="Pause")
-        self._reading_thread = threading.Thread(target=self._reading_worker, daemon=True)
+        self.btn_stop.config(state="normal")
+        args = (chunks, read_slice, self._reading_stop)
+        self._reading_thread = threading.Thread(target=self._reading_worker, args=args, daemon=True)
         self._reading_thread.start()
 
-    def _reading_worker(self):
-        full_text = self.text_en.get("1.0", "end-1c")
+    @staticmethod
+    def _speed_label(speed: float) -> str:
+        return f"{speed:g}×"
+
+    def set_reading_speed(self):
+        """Apply the speed chosen in ``speed_var``; a running reading switches from its next clip."""
+
+        self.reading_speed = float(self.speed_var.get().rstrip("×"))
+        if not self.prefetcher.enabled and self.reading_speed != 1.0:
+            messagebox.showinfo("Reading speed", "Đổi tốc độ đọc cần TTS backend có hàm synthesize().")
+            self.speed_var.set(self._speed_label(1.0))
+            self.reading_speed = 1.0
+
+    def seek_sentence(self, step: int):
+        """Restart continuous reading ``step`` sentences before or after the current one."""
+
+        if self._reading_mode != "continuous" or self._reading_anchor is None:
+            return
+        if not (self._reading_thread and self._reading_thread.is_alive()):
+            return
+        position, offset = self._reading_anchor
+        self._reading_stop.set()
+        self.playback.stop()
+        self._clear_reading_highlight()
+        index = self._reading_index
+        anchor = (position, offset + step)
+        self._launch_reading("continuous", index.sentences_from(*anchor), index.read_slice, index, anchor)
+
+    def _reading_source(self) -> Callable[[int, int], str]:
+        """Return a thread-safe ``slice(start, end)`` over the text being read."""
+
+        if self.document is not None:
+            return self.document.slice
+        content = self.text_en.get("1.0", "end-1c")
+        base = self.page_base
+        return lambda start, end: content[start - base : end - base]
+
+    def _reading_worker(self, chunks, read_slice: Callable[[int, int], str], stop: threading.Event):
+        """Read ``chunks`` (absolute spans); widgets are only touched through ``self.ui``."""
+
+        playing = False
         try:
-            if self._reading_mode == "paragraph":
-                paragraphs = [p.strip() for p in full_text.split("\n\n") if p.strip()]
-                for paragraph in paragraphs:
-                    self._highlight_sentence_once(full_text, paragraph)
-                    self.tts.speak(paragraph)
-                    self._wait_audio_or_pause()
-                    self._clear_reading_highlight()
-            elif self._reading_mode == "sentence":
-                sentence = self._get_current_sentence(full_text)
-                if sentence:
-                    self._highlight_sentence_once(full_text, sentence)
-                    self.tts.speak(sentence)
-                    self._wait_audio_or_pause()
-                    self._clear_reading_highlight()
-            elif self._reading_mode == "word":
-                try:
-                    snippet = self.text_en.get("sel.first", "sel.last").strip()
-                except tk.TclError:
-                    idx = self.text_en.index("insert wordstart")
-                    snippet = self.text_en.get(idx, "insert wordend").strip()
-                if snippet:
-                    try:
-                        start = self.text_en.index("sel.first")
-                        end = self.text_en.index("sel.last")
-                    except tk.TclError:
-                        start = self.text_en.index("insert wordstart")
-                        end = self.text_en.index("insert wordend")
-                    self.text_en.tag_add("reading", start, end)
-                    self.tts.speak(snippet)
-                    self._wait_audio_or_pause()
-                    self._clear_reading_highlight()
+            window = list(islice(chunks, PREFETCH_DEPTH + 1))
+            while window and not stop.is_set():
+                start, end = window.pop(0)
+                window.extend(islice(chunks, 1))
+                raw = read_slice(start, end)
+                text = raw.strip()
+                if not text:
+                    continue
+                base = start + len(raw) - len(raw.lstrip())
+                if not self.prefetcher.enabled:
+                    self.ui.post(self._show_reading_chunk, stop, start, end, base, [])
+                    self.tts.speak(text)
+                    self._wait_audio_or_pause(stop)
+                    self.ui.post(self._clear_run_highlight, stop)
+                    continue
+                upcoming = [read_slice(*span).strip() for span in window]
+                sound, timings = self._load_clip(text, upcoming, self.reading_speed)
+                if stop.is_set():
+                    break
+                if playing and self.playback.enqueue(sound, stop):
+                    self.playback.wait()
+                elif not playing:
+                    self.playback.play(sound, stop)
+                if stop.is_set():
+                    break
+                self.ui.post(self._clear_run_highlight, stop)
+                self.ui.post(self._show_reading_chunk, stop, start, end, base, timings)
+                playing = True
+            if playing and not stop.is_set():
+                self.playback.wait()
         finally:
-            self.btn_pause.config(state="disabled", text="Pause")
+            if stop is self._reading_stop:
+                self.prefetcher.cancel()
+            self.ui.post(self._reading_finished, stop)
+
+    def _show_reading_chunk(
+        self, stop: threading.Event, start: int, end: int, base: int, timings: List[Tuple[float, float, int, int]]
+    ):
+        if stop.is_set():
+            return
+        self._reading_anchor = (start, 0)
+        self._highlight_range(start, end)
+        if timings:
+            self._start_word_timer(base, timings)
+
+    def _clear_run_highlight(self, stop: threading.Event):
+        if not stop.is_set():
+            self._clear_reading_highlight()
+
+    def _reading_finished(self, stop: threading.Event):
+        if stop is not self._reading_stop:
+            return
+        self._clear_reading_highlight()
+        self.btn_pause.config(state="disabled", text="Pause")
+        self.btn_stop.config(state="disabled")
+
+    def _document_audio_path(self) -> str:
+        if self.document is not None:
+            info = os.stat(self.text_path)
+            source = f"{os.path.abspath(self.text_path)}|{info.st_size}|{info.st_mtime}"
+        else:
+            source = self.text_en.get("1.0", "end-1c")
+        return os.path.join(RENDER_DIR, text_digest(source) + ".wav")
+
+    def render_document_audio(self):
+        if not self.audio_cache.enabled:
+            messagebox.showinfo("Render", "TTS backend không hỗ trợ synthesize(), không thể tạo audio trước.")
+            return
+        if self._render_cancel is not None:
+            messagebox.showinfo("Render", "Đang tạo audio, vui lòng chờ.")
+            return
+        os.makedirs(RENDER_DIR, exist_ok=True)
+        ensure_mixer()
+        self._render_cancel = threading.Event()
+        args = (list(self._paragraph_spans()), self._reading_source(), self._document_audio_path(), self._render_cancel)
+        self._render_thread = threading.Thread(target=self._render_worker, args=args, daemon=True)
+        self._render_thread.start()
+        self._show_progress("Đang tạo audio…", 0.0)
+        self.btn_stop.config(state="normal")
+
+    def _cancel_render(self):
+        if self._render_cancel is not None:
+            self._render_cancel.set()
+
+    def _render_worker(self, spans, read_slice: Callable[[int, int], str], wav_path: str, cancelled: threading.Event):
+        def progress(fraction: float):
+            self.ui.post(self._show_progress, "Đang tạo audio…", fraction)
+
+        try:
+            chunks = list(SentenceIndex(spans, read_slice).sentences_from(0))
+            rendered = RenderedAudio.render(self.audio_cache, chunks, read_slice, wav_path, progress, cancelled)
+            if rendered is not None:
+                self._prune_renders(wav_path)
+        except Exception as exc:
+            self.ui.post(self._render_finished, None, exc)
+            return
+        self.ui.post(self._render_finished, rendered, None)
+
+    @staticmethod
+    def _prune_renders(keep: str):
+        """Delete every render but ``keep``; renders sit outside the audio cache's size limit."""
+
+        for entry in os.scandir(RENDER_DIR):
+            if entry.is_file() and entry.path not in (keep, keep + ".json"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _render_finished(self, rendered: RenderedAudio | None, error: Exception | None):
+        self._render_cancel = None
+        self._hide_progress()
+        if self._rendered_job is None and not (self._reading_thread and self._reading_thread.is_alive()):
+            self.btn_stop.config(state="disabled")
+        if error is not None:
+            messagebox.showerror("Render", str(error))
+        elif rendered is not None:
+            self.rendered = rendered
+            messagebox.showinfo("Render", "Đã tạo audio cho cả văn bản.")
+
+    def play_rendered_audio(self):
+        if (self._reading_thread and self._reading_thread.is_alive()) or self._rendered_job is not None:
+            messagebox.showinfo("Reading", "Đang đọc. Hãy Pause/Resume hoặc chờ xong.")
+            return
+        wav_path = self._document_audio_path()
+        if self.rendered is None or self.rendered.wav_path != wav_path:
+            self.rendered = RenderedAudio.load(wav_path)
+        if self.rendered is None:
+            messagebox.showinfo("Render", "Chưa có audio cho văn bản này. Hãy chọn Render Document Audio trước.")
+            return
+        ensure_mixer()
+        pygame.mixer.music.load(self.rendered.wav_path)
+        pygame.mixer.music.play()
+        self._reading_pause.clear()
+        self._rendered_segment = None
+        self.btn_pause.config(state="normal", text="Pause")
+        self.btn_stop.config(state="normal")
+        self._rendered_job = self.after(RENDER_FOLLOW_MS, self._follow_rendered)
+
+    def _follow_rendered(self):
+        """Move the reading highlight to the segment the rendered file is playing."""
+
+        segment = self.rendered.segment_at(pygame.mixer.music.get_pos() / 1000)
+        if segment != self._rendered_segment:
+            self._clear_reading_highlight()
+            if segment is not None:
+                self._highlight_range(*self.rendered.segments[segment][2:])
+            self._rendered_segment = segment
+        if not pygame.mixer.music.get_busy() and not self._reading_pause.is_set():
+            self._rendered_job = None
+            self._stop_rendered()
+            return
+        self._rendered_job = self.after(RENDER_FOLLOW_MS, self._follow_rendered)
+
+    def _stop_rendered(self):
+        if self._rendered_job is not None:
+            self.after_cancel(self._rendered_job)
+            self._rendered_job = None
+        pygame.mixer.music.stop()
+        self._clear_reading_highlight()
+        self._reading_finished(self._reading_stop)
+
+    def _load_clip(self, text: str, upcoming: List[str], speed: float):
+        """Fetch the clip for ``text`` and its word timings, and start synthesizing ``upcoming``."""
+
+        # Before scheduling: speed variants are decoded in the prefetch workers.
+        ensure_mixer()
+        self.prefetcher.schedule([text, *upcoming], speed)
+        path = self.prefetcher.get(text, speed)
+        sound = self.sounds.load(self.audio_cache.key(text, speed), path)
+        return sound, self.audio_cache.word_timings(text, path, sound.get_length())
+
+    def _start_word_timer(self, base: int, timings: List[Tuple[float, float, int, int]]):
+        if self._word_timer is not None:
+            self.after_cancel(self._word_timer)
+        self._word_base = base
+        self._word_timings = timings
+        self._word_starts = [row[0] for row in timings]
+        self._word_index = -1
+        self._advance_word_highlight()
+
+    def _advance_word_highlight(self):
+        """Highlight the word being spoken, then sleep until the next word starts."""
+
+        self._word_timer = None
+        if self.playback.paused:
+            self._word_timer = self.after(100, self._advance_word_highlight)
+            return
+        elapsed = self.playback.elapsed()
+        index = bisect_right(self._word_starts, elapsed) - 1
+        if index >= 0 and index != self._word_index:
+            self._word_index = index
+            self.text_en.tag_remove("reading_word", "1.0", "end")
+            start = self._word_base + self._word_timings[index][2]
+            if self._page_contains(start):
+                end = self._word_base + self._word_timings[index][3]
+                self.text_en.tag_add("reading_word", self._abs_to_index(start), self._abs_to_index(end))
+        if index + 1 < len(self._word_starts):
+            delay = int((self._word_starts[index + 1] - elapsed) * 1000)
+            self._word_timer = self.after(max(15, delay), self._advance_word_highlight)
+
+    def _wait_audio_or_pause(self, stop: threading.Event):
+        """Wait for a clip started by ``speak()``, which reports neither its length nor its end."""
 
-    def _wait_audio_or_pause(self):
         while pygame.mixer.get_busy():
-            if self._reading_stop.is_set():
+            if stop.wait(0.1 if self._reading_pause.is_set() else 0.05):
                 pygame.mixer.stop()
                 break
-            if self._reading_pause.is_set():
-                time.sleep(0.1)
-                continue
-            time.sleep(0.05)
 
-    def _highlight_sentence_once(self, full_text: str, segment: str):
-        start = full_text.find(segment)
-        if start == -1:
+    def _highlight_range(self, start: int, end: int):
+        self._reading_range = (start, end)
+        if self.document is not None and not self._page_contains(start):
+            self._load_page_around(start)
             return
-        end = start + len(segment)
-        start_index = self._abs_to_index(start, full_text)
-        end_index = self._abs_to_index(end, full_text)
-        self.text_en.tag_add("reading", start_index, end_index)
+        self.text_en.tag_add("reading", self._abs_to_index(start), self._abs_to_index(end))
 
     def _clear_reading_highlight(self):
+        self._reading_range = None
         self.text_en.tag_remove("reading", "1.0", "end")
+        self.text_en.tag_remove("reading_word", "1.0", "end")
+        if self._word_timer is not None:
+            self.after_cancel(self._word_timer)
+            self._word_timer = None
+
+    def stop_reading(self):
+        self._cancel_render()
+        if self._rendered_job is not None:
+            self._stop_rendered()
+        self._reading_stop.set()
+        self._reading_pause.clear()
+        self.prefetcher.cancel()
+        self.playback.stop()
+        if not self.prefetcher.enabled and pygame.mixer.get_init():
+            pygame.mixer.unpause()
+        self.btn_pause.config(text="Pause")
 
     def toggle_pause(self):
+        if self._rendered_job is not None:
+            if self._reading_pause.is_set():
+                self._reading_pause.clear()
+                pygame.mixer.music.unpause()
+                self.btn_pause.config(text="Pause")
+            else:
+                self._reading_pause.set()
+                pygame.mixer.music.pause()
+                self.btn_pause.config(text="Resume")
+            return
         if not (self._reading_thread and self._reading_thread.is_alive()):
             return
         if not self._reading_pause.is_set():
             self._reading_pause.set()
+            if self.prefetcher.enabled:
+                self.playback.pause()
+            elif pygame.mixer.get_init():
+                pygame.mixer.pause()
             self.btn_pause.config(text="Resume")
         else:
             self._reading_pause.clear()
+            if self.prefetcher.enabled:
+                self.playback.resume()
+            elif pygame.mixer.get_init():
+                pygame.mixer.unpause()
             self.btn_pause.config(text="Pause")
 
     def on_change_font(self, value):
-        self.font_size = max(MIN_FONT, min(MAX_FONT, int(float(value))))
-        self.text_en.config(font=("Segoe UI", self.font_size))
-        self.text_vi.config(font=("Segoe UI", self.font_size))
+        size = max(MIN_FONT, min(MAX_FONT, int(float(value))))
+        if size != self._preview_font_size:
+            self._preview_font_size = size
+            self.text_en.config(font=("Segoe UI", size))
+            self.text_vi.config(font=("Segoe UI", size))
+        if self._font_job is not None:
+            self.after_cancel(self._font_job)
+        self._font_job = self.after(FONT_DEBOUNCE_MS, self._commit_font_size)
+
+    def _commit_font_size(self):
+        self._font_job = None
+        if self._preview_font_size == self.font_size:
+            return
+        if self._restoring:
+            self._font_job = self.after(FONT_DEBOUNCE_MS, self._commit_font_size)
+            return
+        self.font_size = self._preview_font_size
         self._configure_tree_style()
         self._refresh_number_widgets()
+        self._journal_settings()
 
     def _find_paragraph(self, full_text: str, start: int, end: int) -> str:
         left = full_text.rfind("\n\n", 0, start)
@@ -577,7 +2935,7 @@ class VocabReaderApp(tk.Tk):
         return ""
 
     def _fetch_word_info(self, selection: str, paragraph: str) -> Dict[str, str]:
-        cache_key = f"{selection.lower()}|{abs(hash(paragraph))}"
+        cache_key = f"{selection.lower()}|{text_digest(paragraph)}"
         if cache_key in self.llm_cache:
             return self.llm_cache[cache_key]
         lookup = api.lookup_dictionaryapi(selection)
@@ -658,10 +3016,9 @@ class VocabReaderApp(tk.Tk):
         return lemma
 
     def speak_selected_word(self):
-        selection = self.tree.selection()
-        if not selection:
+        key = self.dict_table.selected
+        if key is None:
             return
-        key = selection[0]
         entry = self.entries.get(key)
         if entry:
             self._speak_entry_text(entry, use_surface=True)
@@ -673,17 +3030,38 @@ class VocabReaderApp(tk.Tk):
         if not text:
             return
         try:
-            self.tts.speak(text)
+            self._speak_cached(text)
         except Exception as exc:
             messagebox.showerror("TTS", str(exc))
 
-    def _on_tree_select(self, _event):
-        if self._suppress_lemma_speak:
+    def _speak_cached(self, text: str):
+        """Play ``text`` from the audio cache; a miss is synthesized on a worker thread."""
+
+        if not self.audio_cache.enabled:
+            self.tts.speak(text)
+            return
+        path = self.audio_cache.lookup(text)
+        if path is None:
+            threading.Thread(target=self._synthesize_and_play, args=(text,), daemon=True).start()
+            return
+        self._play_cached(text, path)
+
+    def _synthesize_and_play(self, text: str):
+        try:
+            path = self.audio_cache.fetch(text)
+        except Exception as exc:
+            self.ui.post(messagebox.showerror, "TTS", str(exc))
             return
-        selection = self.tree.selection()
-        if not selection:
+        self.ui.post(self._play_cached, text, path)
+
+    def _play_cached(self, text: str, path: str):
+        ensure_mixer()
+        self.sounds.load(self.audio_cache.key(text), path).play()
+
+    def _on_tree_select(self, _event):
+        key = self.dict_table.take_selection()
+        if key is None or self._suppress_lemma_speak:
             return
-        key = selection[0]
         entry = self.entries.get(key)
         if entry:
             self._speak_entry_text(entry, use_surface=False)
@@ -691,7 +3069,7 @@ class VocabReaderApp(tk.Tk):
 
     def _on_tree_button_press(self, event):
         column = self.tree.identify_column(event.x)
-        row = self.tree.identify_row(event.y)
+        row = self.dict_table.key_of(self.tree.identify_row(event.y))
         if column == "#1" and row:
             self._suppress_lemma_speak = True
             self._pending_context_item = row
@@ -711,28 +3089,31 @@ class VocabReaderApp(tk.Tk):
         self._suppress_lemma_speak = False
 
     def delete_selected_word(self):
-        selection = self.tree.selection()
-        if not selection:
+        if self._restoring:
+            messagebox.showinfo("Xoá", "Đang khôi phục phiên học, vui lòng chờ.")
+            return
+        key = self.dict_table.selected
+        if key is None:
             return
-        key = selection[0]
         entry = self.entries.pop(key, None)
         if not entry:
             return
+        rank = self.entry_index.discard(key)
+        self.search_index.remove(key)
+        self.journal.append({"op": "delete", "key": key})
         self._remove_entry_highlight(key, entry)
-        self.tree.delete(key)
+        self._refresh_dict_table()
         self._update_vietsub_highlights()
-        self._update_entry_numbers()
+        self._update_entry_numbers(rank or 0)
         if key == self._active_tree_item:
             self._clear_tree_highlight()
 
     def _entries_sorted_by_offset(self) -> List[WordEntry]:
-        def key_fn(entry: WordEntry) -> Tuple[int, int]:
-            if entry.offsets:
-                info = entry.offsets[0]
-                return info.get("abs_start", 10**9), info.get("abs_end", 10**9)
-            return 10**9, 10**9
+        return [self.entries[key] for key in self.entry_index]
 
-        return sorted(self.entries.values(), key=key_fn)
+    def _store_entry(self, key: str, entry: WordEntry) -> int:
+        self.entries[key] = entry
+        return self.entry_index.add(key, *self._entry_sort_key(entry))
 
     def _entry_key(self, word: str, sentence: str) -> str:
         """Create a stable key for dictionary entries.
@@ -742,39 +3123,56 @@ class VocabReaderApp(tk.Tk):
         still differentiating the same word appearing in different contexts.
         """
 
-        return f"{word.lower()}|{abs(hash(sentence))}"
+        return f"{word.lower()}|{text_digest(sentence)}"
 
-    def _refresh_tree_sorted(self):
-        self.tree.delete(*self.tree.get_children())
-        for index, entry in enumerate(self._entries_sorted_by_offset(), start=1):
-            key = self._entry_key(entry.display, entry.context_sentence)
-            values = [index, entry.display, entry.pos, entry.vi_meaning]
-            self.tree.insert("", "end", iid=key, values=values)
+    def _entry_keys_between(self, first: str, last: str):
+        return self.entry_index.keys_between(self._index_to_abs_pos(first), self._index_to_abs_pos(last))
+
+    def _entry_sort_key(self, entry: WordEntry) -> Tuple[int, int]:
+        if entry.offsets:
+            info = entry.offsets[0]
+            return info.get("abs_start", 10**9), info.get("abs_end", 10**9)
+        return 10**9, 10**9
+
+    def _reset_tree_view(self):
+        self.dict_table.top = 0
         self._clear_tree_highlight()
+        self._apply_search()
+
+    def _apply_search(self):
+        matches = self.search_index.search(self.search_var.get())
+        if matches is not None and self._restoring:
+            # The search index is complete before the entries are all inserted.
+            matches = {key for key in matches if key in self.entries}
+        self.dict_table.set_filter(matches)
+
+    def _refresh_dict_table(self):
+        if self.dict_table.matches is None:
+            self.dict_table.refresh()
+        else:
+            top = self.dict_table.top
+            self._apply_search()
+            self.dict_table.top = top
+
+    def _tree_row_values(self, key: str, number: int) -> List:
+        entry = self.entries[key]
+        return [number, entry.display, entry.pos, entry.vi_meaning]
 
     def _apply_tree_highlight(self, item: str, column: str):
         column_name = self._tree_column_name(column)
-        if not column_name or not self.tree.exists(item):
+        if not column_name or item not in self.entries:
             self._clear_tree_highlight()
             return
         tag = self._ensure_tree_highlight_tag(column_name)
         if self._active_tree_item == item and self._active_tree_tag == tag:
             return
-        self._clear_tree_highlight()
-        tags = list(self.tree.item(item, "tags") or [])
-        if tag not in tags:
-            tags.append(tag)
-        self.tree.item(item, tags=tuple(tags))
+        self.dict_table.mark(item, tag)
         self._active_tree_item = item
         self._active_tree_tag = tag
         self._active_tree_column = column_name
 
     def _clear_tree_highlight(self):
-        if self._active_tree_item and self._active_tree_tag and self.tree.exists(self._active_tree_item):
-            tags = list(self.tree.item(self._active_tree_item, "tags") or [])
-            if self._active_tree_tag in tags:
-                tags.remove(self._active_tree_tag)
-                self.tree.item(self._active_tree_item, tags=tuple(tags))
+        self.dict_table.mark(None)
         self._active_tree_item = None
         self._active_tree_tag = None
         self._active_tree_column = None
@@ -830,30 +3228,28 @@ class VocabReaderApp(tk.Tk):
             self._active_tree_column = None
             self._apply_tree_highlight(item, column)
 
-    def _apply_entry_highlight(self, key: str, entry: WordEntry):
-        full_text = self.text_en.get("1.0", "end-1c")
+    def _apply_entry_highlight(self, key: str, entry: WordEntry, batch: HighlightBatch | None = None):
         if not entry.offsets:
             return
         data = entry.offsets[0]
-        start_index = self._abs_to_index(data["abs_start"], full_text)
-        end_index = self._abs_to_index(data["abs_end"], full_text)
-        surface = entry.surface or self.text_en.get(start_index, end_index)
-        word_end = self.text_en.index(f"{start_index}+{len(surface)}c")
-        self.text_en.tag_add("word_highlight", start_index, word_end)
+        if not self._page_contains(data["abs_start"]):
+            return
+        pending = batch or HighlightBatch(self.text_en, self._line_starts)
+        local_start = data["abs_start"] - self.page_base
+        length = len(entry.surface) if entry.surface else data["abs_end"] - data["abs_start"]
+        start_index = pending.index(local_start)
+        word_end = pending.index(local_start + length)
+        pending.tag("word_highlight", start_index, word_end)
         start_mark = f"start_{key}"
         end_mark = f"end_{key}"
-        self.text_en.mark_set(start_mark, start_index)
-        self.text_en.mark_set(end_mark, word_end)
-        self.text_en.mark_gravity(start_mark, tk.LEFT)
-        self.text_en.mark_gravity(end_mark, tk.LEFT)
-        self.entry_marks_en[key] = {"start": start_mark, "end": end_mark}
         number_mark = f"number_en_{key}"
-        self.text_en.mark_set(number_mark, start_index)
-        self.text_en.mark_gravity(number_mark, tk.LEFT)
-        widget = self._create_number_widget(self.text_en)
-        self.text_en.window_create(number_mark, window=widget["frame"], align="top")
-        widget["mark"] = number_mark
-        self.number_widgets_en[key] = widget
+        pending.mark(start_mark, start_index)
+        pending.mark(end_mark, word_end)
+        pending.mark(number_mark, start_index)
+        self.entry_marks_en[key] = {"start": start_mark, "end": end_mark}
+        self.bubbles_en.track(key, number_mark)
+        if batch is None:
+            pending.apply()
 
     def _remove_entry_highlight(self, key: str, entry: WordEntry):
         marks = self.entry_marks_en.pop(key, None)
@@ -863,193 +3259,314 @@ class VocabReaderApp(tk.Tk):
             self.text_en.tag_remove("word_highlight", start_mark, end_mark)
             self.text_en.mark_unset(start_mark)
             self.text_en.mark_unset(end_mark)
-        self._remove_number_widget(self.text_en, self.number_widgets_en, key)
-
-    def _create_number_widget(self, widget: tk.Text) -> Dict[str, object]:
-        frame = tk.Frame(widget, bg=HIGHLIGHT_COLOR, highlightthickness=0, bd=0)
-        label = tk.Label(
-            frame,
-            text="",
-            bg=HIGHLIGHT_COLOR,
-            fg="#000000",
-            padx=0,
-            pady=0,
-            anchor="nw",
-        )
-        label.place(x=0, y=0, anchor="nw")
-        bundle = {"frame": frame, "label": label, "widget": widget}
-        self._style_number_widget(bundle)
-        return bundle
-
-    def _style_number_widget(self, bundle: Dict[str, object]):
-        widget: tk.Text = bundle["widget"]  # type: ignore[assignment]
-        frame: tk.Frame = bundle["frame"]  # type: ignore[assignment]
-        label: tk.Label = bundle["label"]  # type: ignore[assignment]
-        text_font = tkfont.Font(font=widget["font"])
-        line_height = text_font.metrics("linespace")
-        number_font_size = max(8, int(self.font_size / 3))
-        label.config(font=("Segoe UI", number_font_size, "bold"))
-        width = max(12, text_font.measure("0") + 2)
-        frame.config(width=width, height=line_height, bg=HIGHLIGHT_COLOR)
-        frame.pack_propagate(False)
+        self.bubbles_en.remove(key)
+
+    def _bubble_font_size(self) -> int:
+        return max(8, int(self.font_size / 3))
 
     def _refresh_number_widgets(self):
-        for bundle in list(self.number_widgets_en.values()):
-            self._style_number_widget(bundle)
-        for bundle in list(self.number_widgets_vi.values()):
-            self._style_number_widget(bundle)
-
-    def _remove_number_widget(self, widget: tk.Text, store: Dict[str, Dict[str, object]], key: str):
-        bundle = store.pop(key, None)
-        if not bundle:
-            return
-        mark = bundle.get("mark")
-        if mark:
-            try:
-                widget.delete(mark)
-            except tk.TclError:
-                pass
-            widget.mark_unset(mark)
-        frame = bundle.get("frame")
-        if isinstance(frame, tk.Widget):
-            frame.destroy()
+        size = self._bubble_font_size()
+        if self.bubble_font.cget("size") != size:
+            self.bubble_font.configure(size=size)
+        height = self.font_metrics.get("Segoe UI", size, "bold")[0]
+        self.bubbles_en.set_height(height)
+        self.bubbles_vi.set_height(height)
+
+    def _diagnostics_lines(self) -> List[str]:
+        lines = []
+        for name, bubbles in (("English", self.bubbles_en), ("Viet-sub", self.bubbles_vi)):
+            stats = bubbles.pool.stats()
+            lines.append(
+                f"{name} bubbles: {len(bubbles.marks)} marks, {stats['in_use']} labels in use, "
+                f"{stats['idle']} idle, high-water {stats['high_water']}/{stats['limit']}"
+            )
+        audio = self.audio_cache.stats()
+        lines.append(
+            f"Audio cache: {audio['entries']} clips, {audio['bytes'] / 1048576:.1f} MB, "
+            f"hit ratio {audio['hit_ratio']:.0%} ({audio['hits']} hits / {audio['misses']} misses)"
+        )
+        sounds = self.sounds.stats()
+        lines.append(
+            f"Decoded sounds: {sounds['entries']} in memory, {sounds['bytes'] / 1048576:.1f} of "
+            f"{self.sounds.budget / 1048576:.0f} MB, hit ratio {sounds['hit_ratio']:.0%}"
+        )
+        return lines
+
+    def show_diagnostics(self):
+        messagebox.showinfo("Diagnostics", "\n".join(self._diagnostics_lines()))
 
-    def _clear_number_widgets(self, widget: tk.Text, store: Dict[str, Dict[str, object]]):
-        for key in list(store.keys()):
-            self._remove_number_widget(widget, store, key)
-        store.clear()
+    def _on_text_scroll(self, bubbles: NumberBubbleOverlay, scrollbar: ttk.Scrollbar, first: str, last: str):
+        scrollbar.set(first, last)
+        bubbles.schedule_layout()
+        if bubbles is self.bubbles_en and self.document is not None:
+            if self._page_job is not None:
+                self.after_cancel(self._page_job)
+            self._page_job = self.after_idle(self._check_page_swap, float(first), float(last))
 
     def _reapply_highlights_en(self):
         self.text_en.tag_remove("word_highlight", "1.0", "end")
-        for marks in self.entry_marks_en.values():
-            self.text_en.mark_unset(marks["start"])
-            self.text_en.mark_unset(marks["end"])
+        stale = [name for marks in self.entry_marks_en.values() for name in (marks["start"], marks["end"])]
+        if stale:
+            self.text_en.mark_unset(*stale)
         self.entry_marks_en.clear()
-        self._clear_number_widgets(self.text_en, self.number_widgets_en)
-        for key in sorted(self.entries.keys(), key=lambda k: self.entries[k].offsets[0]["abs_start"] if self.entries[k].offsets else 10**9):
-            self._apply_entry_highlight(key, self.entries[key])
+        self.bubbles_en.clear()
+        batch = HighlightBatch(self.text_en, self._line_starts)
+        for key in self.entry_index.keys_between(*self._page_bounds()):
+            self._apply_entry_highlight(key, self.entries[key], batch)
+        batch.apply()
         self._update_entry_numbers()
 
-    def _update_entry_numbers(self):
-        sorted_entries = self._entries_sorted_by_offset()
-        order_map = {self._entry_key(entry.display, entry.context_sentence): idx for idx, entry in enumerate(sorted_entries, start=1)}
-        for key, bundle in self.number_widgets_en.items():
-            number = order_map.get(key, "")
-            label: tk.Label = bundle["label"]  # type: ignore[assignment]
-            label.config(text=str(number) if number else "")
-            frame: tk.Frame = bundle["frame"]  # type: ignore[assignment]
-            frame.config(bg=HIGHLIGHT_COLOR)
-            label.config(bg=HIGHLIGHT_COLOR)
-        for key, bundle in self.number_widgets_vi.items():
-            number = order_map.get(key, "")
-            label: tk.Label = bundle["label"]  # type: ignore[assignment]
-            label.config(text=str(number) if number else "")
-            frame: tk.Frame = bundle["frame"]  # type: ignore[assignment]
-            frame.config(bg=HIGHLIGHT_COLOR)
-            label.config(bg=HIGHLIGHT_COLOR)
+    def _entry_number(self, key: str) -> int | None:
+        rank = self.entry_index.rank(key)
+        return None if rank is None else rank + 1
+
+    def _update_entry_numbers(self, from_rank: int = 0):
+        """Relabel bubbles whose rank may have shifted, i.e. those at ``from_rank`` or later."""
+
+        self.bubbles_en.renumber(from_rank + 1)
+        self.bubbles_vi.renumber(from_rank + 1)
 
     def _on_left_tab_changed(self, _event):
         tab = self.nb_left.nametowidget(self.nb_left.select())
         if tab is self.tab_vi and not self.text_vi.get("1.0", "end-1c").strip():
             self.translate_full_text()
 
-    def translate_full_text(self):
+    def translate_full_text(self, with_alignment: bool = VIETSUB_ALIGNMENT):
         english = self.text_en.get("1.0", "end-1c")
         if not english.strip():
             self.text_vi.delete("1.0", "end")
+            self._set_vi_alignment([])
             self._clear_vietsub_state()
             return
+        cache_key = f"{int(with_alignment)}|{text_digest(english)}"
+        cached = self.translation_cache.get(cache_key)
+        if cached is None:
+            if cache_key not in self._translations_running:
+                self._translations_running.add(cache_key)
+                args = (english, with_alignment, cache_key, self.page_base)
+                threading.Thread(target=self._translation_worker, args=args, daemon=True).start()
+            return
+        self._show_translation(cached, self.page_base)
+
+    def _translation_worker(self, english: str, with_alignment: bool, cache_key: str, page_base: int):
         try:
-            vietnamese = api._openai_chat(
-                [
-                    {
-                        "role": "system",
-                        "content": "You translate English passages into natural Vietnamese. Preserve paragraph breaks exactly.",
-                    },
-                    {"role": "user", "content": english},
-                ],
-                temperature=0.2,
-            )
+            if with_alignment:
+                vietnamese, alignment = self._translate_with_alignment(english)
+            else:
+                vietnamese, alignment = self._translate_plain(english), []
         except Exception as exc:
-            if "insufficient_quota" in str(exc).lower():
-                messagebox.showwarning("OpenAI", "Không thể dịch vì quota. Vui lòng kiểm tra API key.")
-                return
-            messagebox.showerror("Lỗi dịch", str(exc))
+            self.ui.post(self._translation_failed, cache_key, exc)
+            return
+        self.ui.post(self._translation_done, english, cache_key, page_base, {"vietnamese": vietnamese, "alignment": alignment})
+
+    def _translation_failed(self, cache_key: str, exc: Exception):
+        self._translations_running.discard(cache_key)
+        if "insufficient_quota" in str(exc).lower():
+            messagebox.showwarning("OpenAI", "Không thể dịch vì quota. Vui lòng kiểm tra API key.")
             return
+        messagebox.showerror("Lỗi dịch", str(exc))
+
+    def _translation_done(self, english: str, cache_key: str, page_base: int, cached: Dict):
+        self._translations_running.discard(cache_key)
+        self.translation_cache[cache_key] = cached
+        if page_base == self.page_base and self.text_en.get("1.0", "end-1c") == english:
+            self._show_translation(cached, page_base)
+
+    def _show_translation(self, cached: Dict, page_base: int):
         self.text_vi.delete("1.0", "end")
-        self.text_vi.insert("1.0", vietnamese)
+        self.text_vi.insert("1.0", cached["vietnamese"])
+        self._set_vi_alignment(cached["alignment"], page_base)
         self._update_vietsub_highlights()
 
+    def _translate_plain(self, english: str) -> str:
+        return api._openai_chat(
+            [
+                {
+                    "role": "system",
+                    "content": "You translate English passages into natural Vietnamese. Preserve paragraph breaks exactly.",
+                },
+                {"role": "user", "content": english},
+            ],
+            temperature=0.2,
+        )
+
+    def _translate_with_alignment(self, english: str) -> Tuple[str, List[Tuple[int, int, int, int]]]:
+        """Translate the paragraphs and return the text with ``(en_start, en_end, vi_start, vi_end)`` rows."""
+
+        def translate(paragraph: str) -> Tuple[str, List[Tuple[str, str]]]:
+            return self._translate_paragraph_aligned(paragraph) if paragraph.strip() else (paragraph, [])
+
+        paragraphs = english.split("\n\n")
+        with ThreadPoolExecutor(max_workers=ALIGNMENT_WORKERS, thread_name_prefix="vietsub") as pool:
+            translated = list(pool.map(translate, paragraphs))
+        vi_parts: List[str] = []
+        alignment: List[Tuple[int, int, int, int]] = []
+        en_base = 0
+        vi_base = 0
+        for index, (paragraph, (vi_paragraph, pairs)) in enumerate(zip(paragraphs, translated)):
+            if index:
+                vi_parts.append("\n\n")
+                vi_base += 2
+            for en_start, en_end, vi_start, vi_end in self._resolve_alignment_spans(paragraph, vi_paragraph, pairs):
+                alignment.append((en_base + en_start, en_base + en_end, vi_base + vi_start, vi_base + vi_end))
+            vi_parts.append(vi_paragraph)
+            en_base += len(paragraph) + 2
+            vi_base += len(vi_paragraph)
+        alignment.sort()
+        return "".join(vi_parts), alignment
+
+    def _translate_paragraph_aligned(self, paragraph: str) -> Tuple[str, List[Tuple[str, str]]]:
+        prompt = (
+            "You translate English paragraphs into natural Vietnamese for learners. Reply with JSON only, shaped as "
+            '{"translation": "<Vietnamese paragraph>", "alignment": [{"en": "<English span>", "vi": "<Vietnamese span>"}]}. '
+            "List every content word or phrase of the English paragraph in reading order. Each 'en' value must be copied "
+            "exactly from the English paragraph and each 'vi' value exactly from your translation."
+        )
+        raw = api._openai_chat(
+            [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": paragraph},
+            ],
+            temperature=0.2,
+        )
+        text = (raw or "").strip()
+        fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", text, re.DOTALL)
+        if fenced:
+            text = fenced.group(1)
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        translation = str(data.get("translation") or "").strip() if isinstance(data, dict) else ""
+        if not translation:
+            # The reply is not the JSON asked for; never show it as the translation.
+            return self._translate_plain(paragraph).strip(), []
+        pairs: List[Tuple[str, str]] = []
+        for item in data.get("alignment") or []:
+            if isinstance(item, dict) and item.get("en") and item.get("vi"):
+                pairs.append((str(item["en"]), str(item["vi"])))
+        return translation, pairs
+
+    @staticmethod
+    def _find_phrase(text: str, phrase: str, start: int = 0) -> int:
+        """Offset of ``phrase`` as whole words in ``text`` at or after ``start``, or -1."""
+
+        match = re.compile(rf"(?<!\w){re.escape(phrase)}(?!\w)").search(text, start)
+        return match.start() if match else -1
+
+    def _resolve_alignment_spans(
+        self, english: str, vietnamese: str, pairs: List[Tuple[str, str]]
+    ) -> List[Tuple[int, int, int, int]]:
+        en_lower = english.lower()
+        vi_lower = vietnamese.lower()
+        spans: List[Tuple[int, int, int, int]] = []
+        used_vi: set = set()
+        en_cursor = 0
+        for en_text, vi_text in pairs:
+            en_needle = en_text.strip().lower()
+            vi_needle = vi_text.strip().lower()
+            if not en_needle or not vi_needle:
+                continue
+            en_start = self._find_phrase(en_lower, en_needle, en_cursor)
+            if en_start == -1:
+                en_start = self._find_phrase(en_lower, en_needle)
+            if en_start == -1:
+                continue
+            vi_start = self._find_phrase(vi_lower, vi_needle)
+            while vi_start != -1 and vi_start in used_vi:
+                vi_start = self._find_phrase(vi_lower, vi_needle, vi_start + 1)
+            if vi_start == -1:
+                vi_start = self._find_phrase(vi_lower, vi_needle)
+            if vi_start == -1:
+                continue
+            used_vi.add(vi_start)
+            en_cursor = en_start + len(en_needle)
+            spans.append((en_start, en_start + len(en_needle), vi_start, vi_start + len(vi_needle)))
+        return spans
+
+    def _set_vi_alignment(self, alignment: List[Tuple[int, int, int, int]], en_base: int = 0):
+        self.vi_alignment = [(en_start + en_base, en_end + en_base, vi_start, vi_end) for en_start, en_end, vi_start, vi_end in alignment]
+        self._vi_alignment_starts = [row[0] for row in self.vi_alignment]
+
+    def _aligned_vi_span(self, abs_start: int, abs_end: int) -> Tuple[int, int] | None:
+        position = bisect_right(self._vi_alignment_starts, abs_start) - 1
+        if position < 0:
+            return None
+        _en_start, en_end, vi_start, vi_end = self.vi_alignment[position]
+        if en_end <= abs_start:
+            return None
+        return vi_start, vi_end
+
     def _clear_vietsub_state(self):
         self.text_vi.tag_remove("word_highlight", "1.0", "end")
-        for marks in self.entry_marks_vi.values():
-            self.text_vi.mark_unset(marks["start"])
-            self.text_vi.mark_unset(marks["end"])
+        stale = [name for marks in self.entry_marks_vi.values() for name in (marks["start"], marks["end"])]
+        if stale:
+            self.text_vi.mark_unset(*stale)
         self.entry_marks_vi.clear()
-        self._clear_number_widgets(self.text_vi, self.number_widgets_vi)
+        self.bubbles_vi.clear()
 
     def _update_vietsub_highlights(self):
         self._clear_vietsub_state()
         content = self.text_vi.get("1.0", "end-1c")
         if not content.strip():
             return
-        sorted_entries = self._entries_sorted_by_offset()
-        for entry in sorted_entries:
-            key = self._entry_key(entry.display, entry.context_sentence)
-            meaning = (entry.vi_meaning or "").strip()
-            if not meaning:
-                continue
-            start = self.text_vi.search(meaning, "1.0", stopindex="end", nocase=True)
-            if not start:
-                continue
-            end = self.text_vi.index(f"{start}+{len(meaning)}c")
-            self.text_vi.tag_add("word_highlight", start, end)
-            start_mark = f"vi_start_{key}"
-            end_mark = f"vi_end_{key}"
-            self.text_vi.mark_set(start_mark, start)
-            self.text_vi.mark_set(end_mark, end)
-            self.text_vi.mark_gravity(start_mark, tk.LEFT)
-            self.text_vi.mark_gravity(end_mark, tk.LEFT)
-            self.entry_marks_vi[key] = {"start": start_mark, "end": end_mark}
-            number_mark = f"number_vi_{key}"
-            self.text_vi.mark_set(number_mark, start)
-            self.text_vi.mark_gravity(number_mark, tk.LEFT)
-            widget = self._create_number_widget(self.text_vi)
-            self.text_vi.window_create(number_mark, window=widget["frame"], align="top")
-            widget["mark"] = number_mark
-            self.number_widgets_vi[key] = widget
+        batch = HighlightBatch(self.text_vi, line_start_offsets(content))
+        if self.vi_alignment:
+            for key in self.entry_index:
+                entry = self.entries[key]
+                if not entry.offsets:
+                    continue
+                span = self._aligned_vi_span(entry.offsets[0]["abs_start"], entry.offsets[0]["abs_end"])
+                if not span:
+                    continue
+                self._apply_vi_highlight(key, batch.index(span[0]), batch.index(span[1]), batch)
+        else:
+            for key in self.entry_index:
+                entry = self.entries[key]
+                meaning = (entry.vi_meaning or "").strip()
+                if not meaning:
+                    continue
+                start = self.text_vi.search(meaning, "1.0", stopindex="end", nocase=True)
+                if not start:
+                    continue
+                self._apply_vi_highlight(key, start, f"{start}+{len(meaning)}c", batch)
+        batch.apply()
         self._update_entry_numbers()
 
-    def _get_current_sentence(self, full_text: str):
+    def _apply_vi_highlight(self, key: str, start: str, end: str, batch: HighlightBatch):
+        batch.tag("word_highlight", start, end)
+        start_mark = f"vi_start_{key}"
+        end_mark = f"vi_end_{key}"
+        number_mark = f"number_vi_{key}"
+        batch.mark(start_mark, start)
+        batch.mark(end_mark, end)
+        batch.mark(number_mark, start)
+        self.entry_marks_vi[key] = {"start": start_mark, "end": end_mark}
+        self.bubbles_vi.track(key, number_mark)
+
+    def _get_current_sentence(self) -> Tuple[int, int] | None:
         try:
             idx = self.text_en.index("insert")
         except tk.TclError:
             return None
-        abs_pos = self._index_to_abs_pos(idx, full_text)
+        abs_pos = self._index_to_abs_pos(idx)
         for start, end in self.sentences_cache:
             if start <= abs_pos <= end:
-                return full_text[start:end]
+                return start, end
         return None
 
-    def _index_to_abs_pos(self, tkindex: str, full_text: str) -> int:
-        line, col = map(int, tkindex.split("."))
-        lines = full_text.split("\n")
-        return sum(len(line_text) + 1 for line_text in lines[: line - 1]) + col
-
-    def _abs_to_index(self, abspos: int, full_text: str) -> str:
-        lines = full_text.split("\n")
-        acc = 0
-        for line_no, line_text in enumerate(lines, start=1):
-            if acc + len(line_text) >= abspos:
-                return f"{line_no}.{abspos - acc}"
-            acc += len(line_text) + 1
-        last_line = len(lines)
-        last_col = len(lines[-1]) if lines else 0
-        return f"{last_line}.{last_col}"
+    def _index_to_abs_pos(self, tkindex: str) -> int:
+        local = int(self.text_en.tk.call(self.text_en._w, "count", "-chars", "1.0", tkindex))
+        return self.page_base + local
+
+    def _abs_to_index(self, abspos: int) -> str:
+        local = max(0, abspos - self.page_base)
+        return self.text_en.index(f"1.0+{local}c")
 
     def toggle_theme(self):
         self.theme = "dark" if self.theme == "light" else "light"
         self._apply_theme()
+        self._journal_settings()
 
 
 def ensure_nltk_resources():
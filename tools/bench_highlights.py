@@ -0,0 +1,157 @@
+"""Time highlight application for sessions of 1k, 5k and 20k entries.
+
+The baseline is the per-entry code the app used before ``HighlightBatch`` and
+``NumberBubbleOverlay``: for every entry it reads the whole text, walks its
+lines to turn offsets into indices, tags and marks the word, and embeds a
+styled number widget with ``window_create``; the numbering pass then relabels
+every widget, and a font change restyles every widget
+(``_refresh_number_widgets``). The current path batches the tags and marks and
+numbers only the bubbles in view. Tk needs a display; on a headless machine
+run from the repository root:
+
+    xvfb-run python tools/bench_highlights.py [sizes...]
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import font as tkfont
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OpitonB_000_Main_final import HIGHLIGHT_COLOR, HighlightBatch, NumberBubbleOverlay, line_start_offsets  # noqa: E402
+
+SIZES = (1000, 5000, 20000)
+WORDS_PER_ENTRY = 4
+WORDS_PER_LINE = 12
+FONT_SIZE = 18
+
+
+def build_text(root: tk.Tk, entries: int):
+    words = [f"word{number:05d}" for number in range(entries * WORDS_PER_ENTRY)]
+    lines = [" ".join(words[i : i + WORDS_PER_LINE]) for i in range(0, len(words), WORDS_PER_LINE)]
+    text = tk.Text(root, font=("Segoe UI", FONT_SIZE))
+    content = "\n".join(lines)
+    text.insert("1.0", content)
+    step = len(words[0]) + 1
+    spans = [(f"k{i}", i * WORDS_PER_ENTRY * step, words[0]) for i in range(entries)]
+    return text, content, spans
+
+
+# Baseline, copied from the app before the batched highlights.
+
+
+def baseline_abs_to_index(abspos: int, full_text: str) -> str:
+    lines = full_text.split("\n")
+    acc = 0
+    for line_no, line_text in enumerate(lines, start=1):
+        if acc + len(line_text) >= abspos:
+            return f"{line_no}.{abspos - acc}"
+        acc += len(line_text) + 1
+    return f"{len(lines)}.{len(lines[-1]) if lines else 0}"
+
+
+def baseline_style_number_widget(bundle):
+    widget, frame, label = bundle["widget"], bundle["frame"], bundle["label"]
+    text_font = tkfont.Font(font=widget["font"])
+    line_height = text_font.metrics("linespace")
+    label.config(font=("Segoe UI", max(8, int(FONT_SIZE / 3)), "bold"))
+    width = max(12, text_font.measure("0") + 2)
+    frame.config(width=width, height=line_height, bg=HIGHLIGHT_COLOR)
+    frame.pack_propagate(False)
+
+
+def baseline_create_number_widget(widget: tk.Text):
+    frame = tk.Frame(widget, bg=HIGHLIGHT_COLOR, highlightthickness=0, bd=0)
+    label = tk.Label(frame, text="", bg=HIGHLIGHT_COLOR, fg="#000000", padx=0, pady=0, anchor="nw")
+    label.place(x=0, y=0, anchor="nw")
+    bundle = {"frame": frame, "label": label, "widget": widget}
+    baseline_style_number_widget(bundle)
+    return bundle
+
+
+def baseline_apply(text: tk.Text, spans, widgets):
+    for key, start, surface in spans:
+        full_text = text.get("1.0", "end-1c")
+        start_index = baseline_abs_to_index(start, full_text)
+        baseline_abs_to_index(start + len(surface), full_text)
+        word_end = text.index(f"{start_index}+{len(surface)}c")
+        text.tag_add("word_highlight", start_index, word_end)
+        text.mark_set(f"start_{key}", start_index)
+        text.mark_set(f"end_{key}", word_end)
+        text.mark_gravity(f"start_{key}", tk.LEFT)
+        text.mark_gravity(f"end_{key}", tk.LEFT)
+        number_mark = f"number_en_{key}"
+        text.mark_set(number_mark, start_index)
+        text.mark_gravity(number_mark, tk.LEFT)
+        widget = baseline_create_number_widget(text)
+        text.window_create(number_mark, window=widget["frame"], align="top")
+        widgets[key] = widget
+    order = {key: number for number, (key, _, _) in enumerate(sorted(spans, key=lambda span: span[1]), start=1)}
+    for key, bundle in widgets.items():
+        bundle["label"].config(text=str(order.get(key, "")))
+        bundle["frame"].config(bg=HIGHLIGHT_COLOR)
+        bundle["label"].config(bg=HIGHLIGHT_COLOR)
+
+
+def baseline_restyle(widgets):
+    for bundle in list(widgets.values()):
+        baseline_style_number_widget(bundle)
+
+
+# Current path.
+
+
+def batched_apply(text: tk.Text, content: str, spans, bubbles: NumberBubbleOverlay):
+    batch = HighlightBatch(text, line_start_offsets(content))
+    for key, start, surface in spans:
+        start_index = batch.index(start)
+        word_end = batch.index(start + len(surface))
+        batch.tag("word_highlight", start_index, word_end)
+        batch.mark(f"start_{key}", start_index)
+        batch.mark(f"end_{key}", word_end)
+        batch.mark(f"number_en_{key}", start_index)
+        bubbles.track(key, f"number_en_{key}")
+    batch.apply()
+    bubbles.layout()
+    bubbles.renumber()
+
+
+def batched_restyle(font: tkfont.Font, bubbles: NumberBubbleOverlay):
+    font.configure(size=font.cget("size") + 1)
+    bubbles.set_height(font.metrics("linespace"))
+    bubbles.layout()
+
+
+def timed(action) -> float:
+    began = time.perf_counter()
+    action()
+    return (time.perf_counter() - began) * 1000
+
+
+def main(sizes):
+    root = tk.Tk()
+    root.withdraw()
+    print(f"{'entries':>8} {'baseline apply ms':>18} {'batched apply ms':>17} {'speedup':>8}"
+          f" {'baseline restyle ms':>20} {'batched restyle ms':>19}")
+    for entries in sizes:
+        text, _, spans = build_text(root, entries)
+        widgets = {}
+        slow = timed(lambda: (baseline_apply(text, spans, widgets), text.update_idletasks()))
+        slow_restyle = timed(lambda: (baseline_restyle(widgets), text.update_idletasks()))
+        text.destroy()
+
+        text, content, spans = build_text(root, entries)
+        font = tkfont.Font(root=root, family="Segoe UI", size=max(8, FONT_SIZE // 3), weight="bold")
+        numbers = {key: number for number, (key, _, _) in enumerate(spans, start=1)}
+        bubbles = NumberBubbleOverlay(text, font, font.metrics("linespace"), numbers.get)
+        fast = timed(lambda: (batched_apply(text, content, spans, bubbles), text.update_idletasks()))
+        fast_restyle = timed(lambda: (batched_restyle(font, bubbles), text.update_idletasks()))
+        text.destroy()
+        print(f"{entries:>8} {slow:>18.1f} {fast:>17.1f} {slow / fast:>7.1f}x {slow_restyle:>20.1f} {fast_restyle:>19.1f}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or SIZES)